@@ -0,0 +1,57 @@
+"""Add temporal indexes to memory_units
+
+Revision ID: b3w4x5y6z7a8
+Revises: a2v3w4x5y6z7
+Create Date: 2026-10-15
+
+The temporal retrieval leg filters memory_units by bank and by an OR of
+ranges over occurred_start/occurred_end and mentioned_at. With only
+event_date indexed, every temporal query scanned all of a bank's units.
+These bank-scoped btree indexes give the planner one index per OR arm so it
+can combine them with a BitmapOr:
+  - (bank_id, occurred_start, occurred_end): overlap and occurred_start ranges
+  - (bank_id, occurred_end): occurred_end ranges
+  - (bank_id, mentioned_at): mentioned_at ranges
+"""
+
+from collections.abc import Sequence
+
+from alembic import context, op
+
+revision: str = "b3w4x5y6z7a8"
+down_revision: str | Sequence[str] | None = "a2v3w4x5y6z7"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _get_schema_prefix() -> str:
+    """Get schema prefix for table names (required for multi-tenant support)."""
+    schema = context.config.get_main_option("target_schema")
+    return f'"{schema}".' if schema else ""
+
+
+def upgrade() -> None:
+    """Add bank-scoped indexes on the temporal columns of memory_units."""
+    schema = _get_schema_prefix()
+
+    op.execute(f"""
+        CREATE INDEX IF NOT EXISTS idx_memory_units_bank_occurred
+        ON {schema}memory_units (bank_id, occurred_start, occurred_end)
+    """)
+    op.execute(f"""
+        CREATE INDEX IF NOT EXISTS idx_memory_units_bank_occurred_end
+        ON {schema}memory_units (bank_id, occurred_end)
+    """)
+    op.execute(f"""
+        CREATE INDEX IF NOT EXISTS idx_memory_units_bank_mentioned_at
+        ON {schema}memory_units (bank_id, mentioned_at)
+    """)
+
+
+def downgrade() -> None:
+    """Remove the temporal indexes from memory_units."""
+    schema = _get_schema_prefix()
+
+    op.execute(f"DROP INDEX IF EXISTS {schema}idx_memory_units_bank_mentioned_at")
+    op.execute(f"DROP INDEX IF EXISTS {schema}idx_memory_units_bank_occurred_end")
+    op.execute(f"DROP INDEX IF EXISTS {schema}idx_memory_units_bank_occurred")
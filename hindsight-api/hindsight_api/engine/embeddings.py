@@ -9,6 +9,7 @@ The database schema is automatically adjusted to match the model's dimension.
 Configuration via environment variables - see hindsight_api.config for all env var names.
 """
 
+import importlib.util
 import logging
 import os
 import warnings
@@ -41,6 +42,9 @@ from ..config import (
 
 logger = logging.getLogger(__name__)
 
+# HTTP/2 in httpx needs the optional h2 package; fall back to HTTP/1.1 keep-alive without it
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
 
 class Embeddings(ABC):
     """
@@ -418,7 +422,7 @@ class OpenAIEmbeddings(Embeddings):
             return
 
         try:
-            from openai import OpenAI
+            from openai import DefaultHttpxClient, OpenAI
         except ImportError:
             raise ImportError("openai is required for OpenAIEmbeddings. Install it with: pip install openai")
 
@@ -429,6 +433,12 @@ class OpenAIEmbeddings(Embeddings):
         client_kwargs = {"api_key": self.api_key, "max_retries": self.max_retries}
         if self.base_url:
             client_kwargs["base_url"] = self.base_url
+        # One long-lived pooled HTTP client shared by all encode() calls, so concurrent
+        # batches reuse kept-alive connections. HTTP/2 multiplexing is used when h2 is installed.
+        client_kwargs["http_client"] = DefaultHttpxClient(
+            http2=_HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+        )
         self._client = OpenAI(**client_kwargs)
 
         # Try to get dimension from known models, otherwise do a test embedding
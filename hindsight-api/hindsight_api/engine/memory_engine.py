@@ -2839,7 +2839,7 @@ class MemoryEngine(MemoryEngineInterface):
                         async with acquire_with_retry(pool) as conn:
                             chunks_rows = await conn.fetch(
                                 f"""
-                                SELECT chunk_id, chunk_text, chunk_index
+                                SELECT chunk_id, chunk_text, chunk_index, token_count
                                 FROM {fq_table("chunks")}
                                 WHERE chunk_id = ANY($1::text[])
                                 """,
@@ -2856,7 +2856,10 @@ class MemoryEngine(MemoryEngineInterface):
 
                             row = chunks_lookup[chunk_id]
                             chunk_text = row["chunk_text"]
-                            chunk_tokens = len(encoding.encode(chunk_text))
+                            # Token count is stored at write time; older chunks are tokenized on read
+                            chunk_tokens = row["token_count"]
+                            if chunk_tokens is None:
+                                chunk_tokens = len(encoding.encode(chunk_text))
 
                             # Check if adding this chunk would exceed the limit
                             if total_chunk_tokens + chunk_tokens > max_chunk_tokens:
@@ -13,6 +13,7 @@ import json
 import logging
 import time
 from typing import Any
+from urllib.parse import urlparse
 
 from hindsight_api.engine.llm_interface import LLMInterface, OutputTooLongError
 from hindsight_api.engine.response_models import LLMToolCall, LLMToolCallResult, TokenUsage
@@ -20,6 +21,51 @@ from hindsight_api.metrics import get_metrics_collector
 
 logger = logging.getLogger(__name__)
 
+ANTHROPIC_API_HOST = "api.anthropic.com"
+
+
+def _is_native_anthropic_api(base_url: str | None) -> bool:
+    """
+    Whether requests go to Anthropic's own API rather than a compatible gateway.
+
+    Prompt caching markers are only sent to the native API; some gateways
+    reject content-block fields they don't recognize.
+    """
+    if not base_url:
+        return True
+    return urlparse(base_url).hostname == ANTHROPIC_API_HOST
+
+
+def _cached_system(system_prompt: str) -> list[dict[str, Any]]:
+    """
+    Wrap a system prompt in a text block marked for prompt caching.
+
+    Hindsight's system prompts (fact extraction instructions plus JSON schema,
+    reflect and consolidation prompts) are static across calls while the
+    per-call content lives in the user message, so caching the prefix lets
+    Anthropic skip re-processing it. Prompts below the model's minimum
+    cacheable length are sent uncached by the API.
+    """
+    return [{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}]
+
+
+def _prompt_tokens(usage: Any) -> int:
+    """
+    Total prompt tokens for a response, including tokens written to or read from the prompt cache.
+
+    With prompt caching, Anthropic's usage.input_tokens only counts the uncached
+    part of the prompt. Adding the cache fields back keeps input_tokens meaning
+    "all prompt tokens", the same as OpenAI's prompt_tokens (which include cached
+    tokens), so metrics and TokenUsage stay comparable across providers.
+    """
+    if usage is None:
+        return 0
+    return (
+        (usage.input_tokens or 0)
+        + (getattr(usage, "cache_creation_input_tokens", None) or 0)
+        + (getattr(usage, "cache_read_input_tokens", None) or 0)
+    )
+
 
 class AnthropicLLM(LLMInterface):
     """
@@ -67,10 +113,15 @@ class AnthropicLLM(LLMInterface):
                 client_kwargs["timeout"] = timeout
 
             self._client = AsyncAnthropic(**client_kwargs)
+            self._cache_system_prompt = _is_native_anthropic_api(self.base_url)
             logger.info(f"Anthropic client initialized for model: {self.model}")
         except ImportError as e:
             raise RuntimeError("Anthropic SDK not installed. Run: uv add anthropic or pip install anthropic") from e
 
+    def _system_param(self, system_prompt: str) -> str | list[dict[str, Any]]:
+        """System prompt in the form sent to the API: cacheable block on the native API, plain text otherwise."""
+        return _cached_system(system_prompt) if self._cache_system_prompt else system_prompt
+
     async def verify_connection(self) -> None:
         """
         Verify that the Anthropic provider is configured correctly by making a simple test call.
@@ -167,7 +218,7 @@ class AnthropicLLM(LLMInterface):
         }
 
         if system_prompt:
-            call_params["system"] = system_prompt
+            call_params["system"] = self._system_param(system_prompt)
 
         if temperature is not None:
             call_params["temperature"] = temperature
@@ -207,7 +258,7 @@ class AnthropicLLM(LLMInterface):
 
                 # Record metrics and log slow calls
                 duration = time.time() - start_time
-                input_tokens = response.usage.input_tokens or 0 if response.usage else 0
+                input_tokens = _prompt_tokens(response.usage)
                 output_tokens = response.usage.output_tokens or 0 if response.usage else 0
                 total_tokens = input_tokens + output_tokens
 
@@ -386,7 +437,7 @@ class AnthropicLLM(LLMInterface):
             "max_tokens": max_completion_tokens or 4096,
         }
         if system_prompt:
-            call_params["system"] = system_prompt
+            call_params["system"] = self._system_param(system_prompt)
 
         if temperature is not None:
             call_params["temperature"] = temperature
@@ -410,7 +461,7 @@ class AnthropicLLM(LLMInterface):
                 finish_reason = "tool_calls" if tool_calls else "stop"
 
                 # Extract token usage
-                input_tokens = response.usage.input_tokens or 0
+                input_tokens = _prompt_tokens(response.usage)
                 output_tokens = response.usage.output_tokens or 0
 
                 # Record metrics
@@ -6,52 +6,60 @@ Handles storage of document chunks in the database.
 
 import logging
 
-from ..memory_engine import fq_table
+from ..memory_engine import count_tokens, fq_table
 from .types import ChunkMetadata
 
 logger = logging.getLogger(__name__)
 
 
-async def store_chunks_batch(conn, bank_id: str, document_id: str, chunks: list[ChunkMetadata]) -> dict[int, str]:
+async def store_chunks_for_documents_batch(
+    conn, bank_id: str, chunks_by_doc: dict[str, list[ChunkMetadata]]
+) -> dict[tuple[str, int], str]:
     """
-    Store document chunks in the database.
+    Store chunks for several documents with a single INSERT.
+
+    Chunk IDs are derived from (bank_id, document_id, chunk_index), and each
+    chunk's token count is stored alongside its text.
 
     Args:
         conn: Database connection
         bank_id: Bank identifier
-        document_id: Document identifier
-        chunks: List of ChunkMetadata objects
+        chunks_by_doc: Dictionary mapping document_id to its ChunkMetadata list
 
     Returns:
-        Dictionary mapping global chunk index to chunk_id
+        Dictionary mapping (document_id, chunk_index) to chunk_id
     """
-    if not chunks:
-        return {}
-
-    # Prepare chunk data for batch insert
     chunk_ids = []
+    document_ids = []
     chunk_texts = []
     chunk_indices = []
+    token_counts = []
     chunk_id_map = {}
 
-    for chunk in chunks:
-        chunk_id = f"{bank_id}_{document_id}_{chunk.chunk_index}"
-        chunk_ids.append(chunk_id)
-        chunk_texts.append(chunk.chunk_text)
-        chunk_indices.append(chunk.chunk_index)
-        chunk_id_map[chunk.chunk_index] = chunk_id
+    for document_id, chunks in chunks_by_doc.items():
+        for chunk in chunks:
+            chunk_id = f"{bank_id}_{document_id}_{chunk.chunk_index}"
+            chunk_ids.append(chunk_id)
+            document_ids.append(document_id)
+            chunk_texts.append(chunk.chunk_text)
+            chunk_indices.append(chunk.chunk_index)
+            token_counts.append(count_tokens(chunk.chunk_text))
+            chunk_id_map[(document_id, chunk.chunk_index)] = chunk_id
+
+    if not chunk_ids:
+        return {}
 
-    # Batch insert all chunks
     await conn.execute(
         f"""
-        INSERT INTO {fq_table("chunks")} (chunk_id, document_id, bank_id, chunk_text, chunk_index)
-        SELECT * FROM unnest($1::text[], $2::text[], $3::text[], $4::text[], $5::integer[])
+        INSERT INTO {fq_table("chunks")} (chunk_id, document_id, bank_id, chunk_text, chunk_index, token_count)
+        SELECT * FROM unnest($1::text[], $2::text[], $3::text[], $4::text[], $5::integer[], $6::integer[])
         """,
         chunk_ids,
-        [document_id] * len(chunk_texts),
-        [bank_id] * len(chunk_texts),
+        document_ids,
+        [bank_id] * len(chunk_ids),
         chunk_texts,
         chunk_indices,
+        token_counts,
     )
 
     return chunk_id_map
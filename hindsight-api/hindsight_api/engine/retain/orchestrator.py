@@ -397,12 +397,8 @@ async def retain_batch(
                         actual_doc_id = document_id
                     chunks_by_doc[actual_doc_id].append(chunk)
 
-                # Store chunks for each document
-                for doc_id, doc_chunks in chunks_by_doc.items():
-                    chunk_id_map = await chunk_storage.store_chunks_batch(conn, bank_id, doc_id, doc_chunks)
-                    # Store mapping with document context
-                    for chunk_idx, chunk_id in chunk_id_map.items():
-                        chunk_id_map_by_doc[(doc_id, chunk_idx)] = chunk_id
+                # Store chunks for all documents in one statement
+                chunk_id_map_by_doc = await chunk_storage.store_chunks_for_documents_batch(conn, bank_id, chunks_by_doc)
 
                 log_buffer.append(
                     f"[3] Store chunks: {len(chunks)} chunks for {len(chunks_by_doc)} documents in {time.time() - step_start:.3f}s"
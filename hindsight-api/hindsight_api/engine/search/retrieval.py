@@ -252,6 +252,40 @@ async def retrieve_semantic_bm25_combined(
     return result_dict
 
 
+def _get_best_timestamp(row) -> float | None:
+    """
+    Pick the POSIX timestamp used for temporal proximity scoring of a memory unit row.
+
+    Priority: midpoint of occurred_start/occurred_end, then occurred_start,
+    then occurred_end, then mentioned_at. Works on epoch seconds so the midpoint
+    is plain float arithmetic instead of datetime/timedelta allocations, and
+    reads each column once since this runs for every entry point and spread neighbor.
+    """
+    start = row["occurred_start"]
+    end = row["occurred_end"]
+    if start is not None:
+        return start.timestamp() if end is None else (start.timestamp() + end.timestamp()) / 2
+    if end is not None:
+        return end.timestamp()
+    mentioned_at = row["mentioned_at"]
+    return mentioned_at.timestamp() if mentioned_at is not None else None
+
+
+def _temporal_proximity(best_ts: float | None, mid_ts: float, half_window_days: float, default: float) -> float:
+    """
+    Score how close a row's best timestamp is to the middle of the query window (1.0 at the midpoint, 0.0 at the edges).
+
+    Window constants are precomputed by the caller so each row costs one subtraction.
+    Rows without any date get `default`; a zero-length window scores every dated row 1.0.
+    """
+    if best_ts is None:
+        return default
+    if half_window_days <= 0:
+        return 1.0
+    days_from_mid = abs(best_ts - mid_ts) / 86400
+    return 1.0 - min(days_from_mid / half_window_days, 1.0)
+
+
 async def retrieve_temporal_combined(
     conn,
     query_emb_str: str,
@@ -338,9 +372,11 @@ async def retrieve_temporal_combined(
         if ft in entries_by_ft:
             entries_by_ft[ft].append(ep)
 
-    # Calculate shared temporal parameters
-    total_days = (end_date - start_date).total_seconds() / 86400
-    mid_date = start_date + (end_date - start_date) / 2
+    # Calculate shared temporal parameters once; they are invariant across all scored rows
+    start_ts = start_date.timestamp()
+    end_ts = end_date.timestamp()
+    half_window_days = (end_ts - start_ts) / 86400 / 2
+    mid_ts = (start_ts + end_ts) / 2
 
     # Process each fact type (spreading needs to stay per fact type due to link filtering)
     results_by_ft: dict[str, list[RetrievalResult]] = {}
@@ -361,21 +397,7 @@ async def retrieve_temporal_combined(
             visited.add(unit_id)
 
             # Calculate temporal proximity
-            best_date = None
-            if ep["occurred_start"] is not None and ep["occurred_end"] is not None:
-                best_date = ep["occurred_start"] + (ep["occurred_end"] - ep["occurred_start"]) / 2
-            elif ep["occurred_start"] is not None:
-                best_date = ep["occurred_start"]
-            elif ep["occurred_end"] is not None:
-                best_date = ep["occurred_end"]
-            elif ep["mentioned_at"] is not None:
-                best_date = ep["mentioned_at"]
-
-            if best_date:
-                days_from_mid = abs((best_date - mid_date).total_seconds() / 86400)
-                temporal_proximity = 1.0 - min(days_from_mid / (total_days / 2), 1.0) if total_days > 0 else 1.0
-            else:
-                temporal_proximity = 0.5
+            temporal_proximity = _temporal_proximity(_get_best_timestamp(ep), mid_ts, half_window_days, default=0.5)
 
             ep_result = RetrievalResult.from_db_row(dict(ep))
             ep_result.temporal_score = temporal_proximity
@@ -430,23 +452,9 @@ async def retrieve_temporal_combined(
                 parent_id = str(n["from_unit_id"])
                 _, parent_temporal_score = node_scores.get(parent_id, (0.5, 0.5))
 
-                neighbor_best_date = None
-                if n["occurred_start"] is not None and n["occurred_end"] is not None:
-                    neighbor_best_date = n["occurred_start"] + (n["occurred_end"] - n["occurred_start"]) / 2
-                elif n["occurred_start"] is not None:
-                    neighbor_best_date = n["occurred_start"]
-                elif n["occurred_end"] is not None:
-                    neighbor_best_date = n["occurred_end"]
-                elif n["mentioned_at"] is not None:
-                    neighbor_best_date = n["mentioned_at"]
-
-                if neighbor_best_date:
-                    days_from_mid = abs((neighbor_best_date - mid_date).total_seconds() / 86400)
-                    neighbor_temporal_proximity = (
-                        1.0 - min(days_from_mid / (total_days / 2), 1.0) if total_days > 0 else 1.0
-                    )
-                else:
-                    neighbor_temporal_proximity = 0.3
+                neighbor_temporal_proximity = _temporal_proximity(
+                    _get_best_timestamp(n), mid_ts, half_window_days, default=0.3
+                )
 
                 link_type = n["link_type"]
                 if link_type in ("causes", "caused_by"):
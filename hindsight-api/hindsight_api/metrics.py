@@ -191,7 +191,7 @@ class MetricsCollectorBase:
             model: Model name
             scope: Scope identifier (e.g., "memory", "reflect", "consolidation")
             duration: Call duration in seconds
-            input_tokens: Number of input/prompt tokens
+            input_tokens: Number of input/prompt tokens, including prompt-cache reads and writes
             output_tokens: Number of output/completion tokens
             success: Whether the call was successful
         """
@@ -373,7 +373,7 @@ class MetricsCollector(MetricsCollectorBase):
             model: Model name
             scope: Scope identifier (e.g., "memory", "reflect", "consolidation")
             duration: Call duration in seconds
-            input_tokens: Number of input/prompt tokens
+            input_tokens: Number of input/prompt tokens, including prompt-cache reads and writes
             output_tokens: Number of output/completion tokens
             success: Whether the call was successful
         """
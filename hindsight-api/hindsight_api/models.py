@@ -140,6 +140,9 @@ class MemoryUnit(Base):
             "event_date",
             postgresql_ops={"event_date": "DESC"},
         ),
+        Index("idx_memory_units_bank_occurred", "bank_id", "occurred_start", "occurred_end"),
+        Index("idx_memory_units_bank_occurred_end", "bank_id", "occurred_end"),
+        Index("idx_memory_units_bank_mentioned_at", "bank_id", "mentioned_at"),
         Index(
             "idx_memory_units_opinion_confidence",
             "bank_id",
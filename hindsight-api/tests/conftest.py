@@ -8,6 +8,7 @@ import os
 import filelock
 from pathlib import Path
 from dotenv import load_dotenv
+from sqlalchemy import create_engine
 from hindsight_api import MemoryEngine, LLMConfig, LocalSTEmbeddings, RequestContext
 
 from hindsight_api.engine.cross_encoder import LocalSTCrossEncoder
@@ -100,6 +101,19 @@ def pg0_db_url(db_url, tmp_path_factory, worker_id):
     return url
 
 
+@pytest.fixture(scope="session")
+def pg0_engine(pg0_db_url):
+    """
+    Session-scoped SQLAlchemy engine for synchronous test setup (schema DDL, fixtures data).
+
+    Created once so helpers don't pay dialect/URL initialization per call. Uses
+    AUTOCOMMIT so DDL and fixture writes don't need explicit commits.
+    """
+    engine = create_engine(pg0_db_url, pool_pre_ping=True, pool_size=2, isolation_level="AUTOCOMMIT")
+    yield engine
+    engine.dispose()
+
+
 @pytest.fixture(scope="function")
 def request_context():
     """Provide a default RequestContext for tests."""
@@ -176,6 +190,24 @@ def cross_encoder(tmp_path_factory, worker_id):
 
     return ce
 
+@pytest.fixture(scope="session")
+def tracing():
+    """
+    Session-scoped OpenTelemetry tracing setup.
+
+    The global tracer provider can only be set once per process, so tests that
+    need real tracing share a single initialization instead of calling
+    initialize_tracing() themselves. Not autouse: most tests expect tracing disabled.
+    """
+    from hindsight_api.tracing import initialize_tracing
+
+    initialize_tracing(
+        service_name="test-hindsight",
+        endpoint="http://localhost:4318",
+        deployment_environment="test",
+    )
+
+
 @pytest.fixture(scope="session")
 def query_analyzer():
     return DateparserQueryAnalyzer()
@@ -0,0 +1,92 @@
+"""
+Tests for chunk storage in the retain pipeline.
+"""
+from datetime import datetime, timezone
+
+import pytest
+
+from hindsight_api.engine.memory_engine import count_tokens
+from hindsight_api.engine.retain.chunk_storage import store_chunks_for_documents_batch
+from hindsight_api.engine.retain.types import ChunkMetadata
+
+
+def _chunk(text: str, chunk_index: int, content_index: int = 0) -> ChunkMetadata:
+    return ChunkMetadata(chunk_text=text, fact_count=1, content_index=content_index, chunk_index=chunk_index)
+
+
+@pytest.mark.asyncio
+async def test_store_chunks_for_multiple_documents(memory_no_llm_verify):
+    """Chunks for several documents are stored in one call and mapped by (document_id, chunk_index)."""
+    bank_id = f"test_chunk_storage_{datetime.now(timezone.utc).timestamp()}"
+    chunks_by_doc = {
+        "doc-a": [_chunk("Alice joined the team in March.", 0), _chunk("Alice leads the data project.", 1)],
+        "doc-b": [_chunk("Bob moved to Berlin last year.", 2, content_index=1)],
+    }
+
+    pool = await memory_no_llm_verify._get_pool()
+    async with pool.acquire() as conn:
+        try:
+            for document_id in chunks_by_doc:
+                await conn.execute(
+                    "INSERT INTO documents (id, bank_id, original_text) VALUES ($1, $2, $3)",
+                    document_id,
+                    bank_id,
+                    "original text",
+                )
+
+            chunk_id_map = await store_chunks_for_documents_batch(conn, bank_id, chunks_by_doc)
+
+            assert chunk_id_map == {
+                ("doc-a", 0): f"{bank_id}_doc-a_0",
+                ("doc-a", 1): f"{bank_id}_doc-a_1",
+                ("doc-b", 2): f"{bank_id}_doc-b_2",
+            }
+
+            rows = await conn.fetch(
+                "SELECT chunk_id, document_id, chunk_index, chunk_text FROM chunks WHERE bank_id = $1",
+                bank_id,
+            )
+            stored = {row["chunk_id"]: (row["document_id"], row["chunk_index"], row["chunk_text"]) for row in rows}
+            assert stored == {
+                chunk_id_map[("doc-a", 0)]: ("doc-a", 0, "Alice joined the team in March."),
+                chunk_id_map[("doc-a", 1)]: ("doc-a", 1, "Alice leads the data project."),
+                chunk_id_map[("doc-b", 2)]: ("doc-b", 2, "Bob moved to Berlin last year."),
+            }
+        finally:
+            await conn.execute("DELETE FROM documents WHERE bank_id = $1", bank_id)
+
+
+@pytest.mark.asyncio
+async def test_store_chunks_for_documents_without_chunks(memory_no_llm_verify):
+    """Documents with no chunks produce an empty mapping and no INSERT."""
+    pool = await memory_no_llm_verify._get_pool()
+    async with pool.acquire() as conn:
+        assert await store_chunks_for_documents_batch(conn, "unused-bank", {"doc-a": []}) == {}
+
+
+@pytest.mark.asyncio
+async def test_retain_stores_chunk_token_count(memory, request_context):
+    """Retain writes each chunk's token count alongside its text."""
+    bank_id = f"test_chunk_token_count_{datetime.now(timezone.utc).timestamp()}"
+
+    try:
+        await memory.retain_async(
+            bank_id=bank_id,
+            content="Dr. Sarah Chen leads the quantum computing team at MIT. " * 80,
+            context="research notes",
+            document_id="doc-token-count",
+            request_context=request_context,
+        )
+
+        pool = await memory._get_pool()
+        async with pool.acquire() as conn:
+            rows = await conn.fetch(
+                "SELECT chunk_text, token_count FROM chunks WHERE bank_id = $1",
+                bank_id,
+            )
+
+        assert len(rows) > 0, "Retain should store at least one chunk"
+        for row in rows:
+            assert row["token_count"] == count_tokens(row["chunk_text"])
+    finally:
+        await memory.delete_bank(bank_id, request_context=request_context)
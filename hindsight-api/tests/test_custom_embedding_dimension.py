@@ -12,7 +12,8 @@ import os
 from datetime import datetime
 
 import pytest
-from sqlalchemy import create_engine, text
+import pytest_asyncio
+from sqlalchemy import Engine, text
 
 from hindsight_api import MemoryEngine, RequestContext
 from hindsight_api.engine.cross_encoder import CohereCrossEncoder, LocalSTCrossEncoder, ZeroEntropyCrossEncoder
@@ -49,15 +50,12 @@ def get_test_schema(prefix: str, worker_id: str) -> str:
     return f"{prefix}_{worker_id}"
 
 
-def create_isolated_schema(db_url: str, schema_name: str, dimension: int | None = None):
+def create_isolated_schema(engine: Engine, db_url: str, schema_name: str, dimension: int | None = None):
     """Create an isolated schema with migrations and optional dimension adjustment."""
-    engine = create_engine(db_url)
-
     # Create schema (drop first if exists from previous failed run)
     with engine.connect() as conn:
         conn.execute(text(f"DROP SCHEMA IF EXISTS {schema_name} CASCADE"))
         conn.execute(text(f"CREATE SCHEMA {schema_name}"))
-        conn.commit()
 
     # Run migrations in the isolated schema
     run_migrations(db_url, schema=schema_name)
@@ -67,17 +65,14 @@ def create_isolated_schema(db_url: str, schema_name: str, dimension: int | None
         ensure_embedding_dimension(db_url, dimension, schema=schema_name)
 
 
-def drop_schema(db_url: str, schema_name: str):
+def drop_schema(engine: Engine, schema_name: str):
     """Drop an isolated schema."""
-    engine = create_engine(db_url)
     with engine.connect() as conn:
         conn.execute(text(f"DROP SCHEMA IF EXISTS {schema_name} CASCADE"))
-        conn.commit()
 
 
-def get_column_dimension(db_url: str, schema: str = "public") -> int | None:
+def get_column_dimension(engine: Engine, schema: str = "public") -> int | None:
     """Get the current embedding column dimension from the database."""
-    engine = create_engine(db_url)
     with engine.connect() as conn:
         result = conn.execute(
             text("""
@@ -94,16 +89,14 @@ def get_column_dimension(db_url: str, schema: str = "public") -> int | None:
         return result
 
 
-def get_row_count(db_url: str, schema: str = "public") -> int:
+def get_row_count(engine: Engine, schema: str = "public") -> int:
     """Get the number of rows with embeddings in memory_units."""
-    engine = create_engine(db_url)
     with engine.connect() as conn:
         return conn.execute(text(f"SELECT COUNT(*) FROM {schema}.memory_units WHERE embedding IS NOT NULL")).scalar()
 
 
-def insert_test_embedding(db_url: str, schema: str, dimension: int):
+def insert_test_embedding(engine: Engine, schema: str, dimension: int):
     """Insert a test row with a dummy embedding."""
-    engine = create_engine(db_url)
     embedding = [0.1] * dimension
     embedding_str = "[" + ",".join(str(x) for x in embedding) + "]"
 
@@ -114,15 +107,12 @@ def insert_test_embedding(db_url: str, schema: str, dimension: int):
                 VALUES ('test-bank', 'test text', '{embedding_str}'::vector, NOW(), 'world')
             """)
         )
-        conn.commit()
 
 
-def clear_embeddings(db_url: str, schema: str):
+def clear_embeddings(engine: Engine, schema: str):
     """Clear all rows from memory_units."""
-    engine = create_engine(db_url)
     with engine.connect() as conn:
         conn.execute(text(f"DELETE FROM {schema}.memory_units"))
-        conn.commit()
 
 
 # =============================================================================
@@ -131,60 +121,60 @@ def clear_embeddings(db_url: str, schema: str):
 
 
 @pytest.fixture(scope="class")
-def dimension_test_schema(pg0_db_url, worker_id):
+def dimension_test_schema(pg0_db_url, pg0_engine, worker_id):
     """Create an isolated schema for dimension tests."""
     schema_name = get_test_schema("test_embed_dim", worker_id)
-    create_isolated_schema(pg0_db_url, schema_name)
+    create_isolated_schema(pg0_engine, pg0_db_url, schema_name)
     yield pg0_db_url, schema_name
-    drop_schema(pg0_db_url, schema_name)
+    drop_schema(pg0_engine, schema_name)
 
 
 class TestEmbeddingDimension:
     """Tests for embedding dimension detection and adjustment."""
 
-    def test_dimension_matches_no_change(self, dimension_test_schema):
+    def test_dimension_matches_no_change(self, dimension_test_schema, pg0_engine):
         """When dimension matches, no changes should be made."""
         db_url, schema = dimension_test_schema
 
         # Get initial dimension (should be 384 from migration)
-        initial_dim = get_column_dimension(db_url, schema)
+        initial_dim = get_column_dimension(pg0_engine, schema)
         assert initial_dim == 384, f"Expected 384, got {initial_dim}"
 
         # Call ensure_embedding_dimension with matching dimension
         ensure_embedding_dimension(db_url, 384, schema=schema)
 
         # Dimension should still be 384
-        assert get_column_dimension(db_url, schema) == 384
+        assert get_column_dimension(pg0_engine, schema) == 384
 
-    def test_dimension_change_empty_table(self, dimension_test_schema):
+    def test_dimension_change_empty_table(self, dimension_test_schema, pg0_engine):
         """When table is empty, dimension can be changed."""
         db_url, schema = dimension_test_schema
 
         # Ensure table is empty
-        clear_embeddings(db_url, schema)
-        assert get_row_count(db_url, schema) == 0
+        clear_embeddings(pg0_engine, schema)
+        assert get_row_count(pg0_engine, schema) == 0
 
         # Change dimension to 768
         ensure_embedding_dimension(db_url, 768, schema=schema)
 
         # Verify dimension changed
-        new_dim = get_column_dimension(db_url, schema)
+        new_dim = get_column_dimension(pg0_engine, schema)
         assert new_dim == 768, f"Expected 768, got {new_dim}"
 
         # Change back to 384 for other tests
         ensure_embedding_dimension(db_url, 384, schema=schema)
-        assert get_column_dimension(db_url, schema) == 384
+        assert get_column_dimension(pg0_engine, schema) == 384
 
-    def test_dimension_change_blocked_with_data(self, dimension_test_schema):
+    def test_dimension_change_blocked_with_data(self, dimension_test_schema, pg0_engine):
         """When table has data, dimension change should be blocked."""
         db_url, schema = dimension_test_schema
 
         # Ensure table is empty first
-        clear_embeddings(db_url, schema)
+        clear_embeddings(pg0_engine, schema)
 
         # Insert a test row with 384-dim embedding
-        insert_test_embedding(db_url, schema, 384)
-        assert get_row_count(db_url, schema) == 1
+        insert_test_embedding(pg0_engine, schema, 384)
+        assert get_row_count(pg0_engine, schema) == 1
 
         # Try to change dimension - should raise error
         with pytest.raises(RuntimeError) as exc_info:
@@ -194,10 +184,10 @@ class TestEmbeddingDimension:
         assert "1 rows with embeddings" in str(exc_info.value)
 
         # Dimension should be unchanged
-        assert get_column_dimension(db_url, schema) == 384
+        assert get_column_dimension(pg0_engine, schema) == 384
 
         # Cleanup
-        clear_embeddings(db_url, schema)
+        clear_embeddings(pg0_engine, schema)
 
     def test_local_embeddings_dimension_detection(self, embeddings):
         """Test that LocalSTEmbeddings correctly detects dimension."""
@@ -251,26 +241,61 @@ def openai_embeddings():
 
 
 @pytest.fixture(scope="module")
-def openai_test_schema(pg0_db_url, worker_id, openai_embeddings):
+def openai_test_schema(pg0_db_url, pg0_engine, worker_id, openai_embeddings):
     """Create an isolated schema for OpenAI embedding tests."""
     schema_name = get_test_schema("test_openai_embed", worker_id)
-    create_isolated_schema(pg0_db_url, schema_name, dimension=openai_embeddings.dimension)
+    create_isolated_schema(pg0_engine, pg0_db_url, schema_name, dimension=openai_embeddings.dimension)
     yield pg0_db_url, schema_name
-    drop_schema(pg0_db_url, schema_name)
+    drop_schema(pg0_engine, schema_name)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def cross_encoder():
     """Provide a cross encoder for tests."""
     return LocalSTCrossEncoder()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def query_analyzer():
     """Provide a query analyzer for tests."""
     return DateparserQueryAnalyzer()
 
 
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def openai_memory(openai_test_schema, openai_embeddings, cross_encoder, query_analyzer):
+    """
+    Module-scoped MemoryEngine shared by the OpenAI embedding tests.
+
+    Pool creation and initialization are paid once for the module; tests stay
+    isolated through distinct bank IDs. The pool is sized so concurrent
+    operations inside a test (batch retain, parallel recall strategies) overlap.
+    """
+    db_url, schema_name = openai_test_schema
+
+    memory = MemoryEngine(
+        db_url=db_url,
+        memory_llm_provider=os.getenv("HINDSIGHT_API_LLM_PROVIDER", "groq"),
+        memory_llm_api_key=os.getenv("HINDSIGHT_API_LLM_API_KEY"),
+        memory_llm_model=os.getenv("HINDSIGHT_API_LLM_MODEL", "openai/gpt-oss-120b"),
+        memory_llm_base_url=os.getenv("HINDSIGHT_API_LLM_BASE_URL") or None,
+        embeddings=openai_embeddings,
+        cross_encoder=cross_encoder,
+        query_analyzer=query_analyzer,
+        pool_min_size=2,
+        pool_max_size=max(2, min(8, os.cpu_count() or 1)),
+        run_migrations=False,
+        tenant_extension=SchemaTenantExtension(schema_name),
+        task_backend=SyncTaskBackend(),
+    )
+    await memory.initialize()
+    yield memory
+    try:
+        if memory._pool and not memory._pool._closing:
+            await memory.close()
+    except Exception:
+        pass
+
+
 @pytest.fixture
 def test_bank_id():
     """Provide a unique bank ID for this test run."""
@@ -301,137 +326,64 @@ class TestOpenAIEmbeddings:
         assert len(embeddings[1]) == 1536
         assert all(isinstance(x, float) for x in embeddings[0])
 
-    @pytest.mark.asyncio
-    async def test_openai_embeddings_retain_recall(
-        self,
-        openai_test_schema,
-        openai_embeddings,
-        cross_encoder,
-        query_analyzer,
-        test_bank_id,
-        request_context,
-    ):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_openai_embeddings_retain_recall(self, openai_memory, test_bank_id, request_context):
         """Test retain and recall operations with OpenAI embeddings."""
-        db_url, schema_name = openai_test_schema
-
-        memory = MemoryEngine(
-            db_url=db_url,
-            memory_llm_provider=os.getenv("HINDSIGHT_API_LLM_PROVIDER", "groq"),
-            memory_llm_api_key=os.getenv("HINDSIGHT_API_LLM_API_KEY"),
-            memory_llm_model=os.getenv("HINDSIGHT_API_LLM_MODEL", "openai/gpt-oss-120b"),
-            memory_llm_base_url=os.getenv("HINDSIGHT_API_LLM_BASE_URL") or None,
-            embeddings=openai_embeddings,
-            cross_encoder=cross_encoder,
-            query_analyzer=query_analyzer,
-            pool_min_size=1,
-            pool_max_size=3,
-            run_migrations=False,
-            tenant_extension=SchemaTenantExtension(schema_name),
-            task_backend=SyncTaskBackend(),
+        memory = openai_memory
+
+        # Store some memories
+        await memory.retain_batch_async(
+            bank_id=test_bank_id,
+            contents=[
+                {"content": "Alice works as a software engineer at Google.", "context": "career discussion"},
+                {"content": "Bob is a data scientist specializing in machine learning.", "context": "team introductions"},
+            ],
+            request_context=request_context,
         )
 
-        try:
-            await memory.initialize()
-
-            # Store some memories
-            await memory.retain_async(
-                bank_id=test_bank_id,
-                content="Alice works as a software engineer at Google.",
-                context="career discussion",
-                request_context=request_context,
-            )
-
-            await memory.retain_async(
-                bank_id=test_bank_id,
-                content="Bob is a data scientist specializing in machine learning.",
-                context="team introductions",
-                request_context=request_context,
-            )
-
-            # Recall memories
-            result = await memory.recall_async(
-                bank_id=test_bank_id,
-                query="Who works in technology?",
-                request_context=request_context,
-            )
-
-            assert result is not None
-            assert len(result.results) > 0
+        # Recall memories
+        result = await memory.recall_async(
+            bank_id=test_bank_id,
+            query="Who works in technology?",
+            request_context=request_context,
+        )
 
-            memory_texts = [m.text for m in result.results]
-            assert any(
-                "Alice" in text or "Bob" in text or "software" in text or "data scientist" in text
-                for text in memory_texts
-            ), f"Expected to find relevant memories, got: {memory_texts}"
+        assert result is not None
+        assert len(result.results) > 0
 
-        finally:
-            try:
-                if memory._pool and not memory._pool._closing:
-                    await memory.close()
-            except Exception:
-                pass
+        memory_texts = [m.text for m in result.results]
+        assert any(
+            "Alice" in text or "Bob" in text or "software" in text or "data scientist" in text
+            for text in memory_texts
+        ), f"Expected to find relevant memories, got: {memory_texts}"
 
-    @pytest.mark.asyncio
-    async def test_openai_embeddings_batch_retain(
-        self,
-        openai_test_schema,
-        openai_embeddings,
-        cross_encoder,
-        query_analyzer,
-        test_bank_id,
-        request_context,
-    ):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_openai_embeddings_batch_retain(self, openai_memory, test_bank_id, request_context):
         """Test batch retain with OpenAI embeddings."""
-        db_url, schema_name = openai_test_schema
-
-        memory = MemoryEngine(
-            db_url=db_url,
-            memory_llm_provider=os.getenv("HINDSIGHT_API_LLM_PROVIDER", "groq"),
-            memory_llm_api_key=os.getenv("HINDSIGHT_API_LLM_API_KEY"),
-            memory_llm_model=os.getenv("HINDSIGHT_API_LLM_MODEL", "openai/gpt-oss-120b"),
-            memory_llm_base_url=os.getenv("HINDSIGHT_API_LLM_BASE_URL") or None,
-            embeddings=openai_embeddings,
-            cross_encoder=cross_encoder,
-            query_analyzer=query_analyzer,
-            pool_min_size=1,
-            pool_max_size=3,
-            run_migrations=False,
-            tenant_extension=SchemaTenantExtension(schema_name),
-            task_backend=SyncTaskBackend(),
-        )
+        memory = openai_memory
 
-        try:
-            await memory.initialize()
-
-            contents = [
-                {"content": "Python is my favorite programming language.", "context": "preferences"},
-                {"content": "I prefer dark mode for all my applications.", "context": "preferences"},
-                {"content": "Coffee is essential for morning productivity.", "context": "habits"},
-            ]
-
-            result = await memory.retain_batch_async(
-                bank_id=test_bank_id,
-                contents=contents,
-                request_context=request_context,
-            )
+        contents = [
+            {"content": "Python is my favorite programming language.", "context": "preferences"},
+            {"content": "I prefer dark mode for all my applications.", "context": "preferences"},
+            {"content": "Coffee is essential for morning productivity.", "context": "habits"},
+        ]
 
-            assert len(result) == 3
+        result = await memory.retain_batch_async(
+            bank_id=test_bank_id,
+            contents=contents,
+            request_context=request_context,
+        )
 
-            recall_result = await memory.recall_async(
-                bank_id=test_bank_id,
-                query="What are my preferences?",
-                request_context=request_context,
-            )
+        assert len(result) == 3
 
-            assert recall_result is not None
-            assert len(recall_result.results) > 0
+        recall_result = await memory.recall_async(
+            bank_id=test_bank_id,
+            query="What are my preferences?",
+            request_context=request_context,
+        )
 
-        finally:
-            try:
-                if memory._pool and not memory._pool._closing:
-                    await memory.close()
-            except Exception:
-                pass
+        assert recall_result is not None
+        assert len(recall_result.results) > 0
 
 
 # =============================================================================
@@ -486,12 +438,12 @@ def cohere_cross_encoder():
 
 
 @pytest.fixture(scope="module")
-def cohere_test_schema(pg0_db_url, worker_id, cohere_embeddings):
+def cohere_test_schema(pg0_db_url, pg0_engine, worker_id, cohere_embeddings):
     """Create an isolated schema for Cohere embedding tests."""
     schema_name = get_test_schema("test_cohere_embed", worker_id)
-    create_isolated_schema(pg0_db_url, schema_name, dimension=cohere_embeddings.dimension)
+    create_isolated_schema(pg0_engine, pg0_db_url, schema_name, dimension=cohere_embeddings.dimension)
     yield pg0_db_url, schema_name
-    drop_schema(pg0_db_url, schema_name)
+    drop_schema(pg0_engine, schema_name)
 
 
 class TestCohereEmbeddings:
@@ -451,10 +451,7 @@ with a concert surrounded by music, joy and the warm summer breeze.
                 fact_date_str = birthday_fact.occurred_start
                 assert fact_date_str is not None, "occurred_start should not be None for temporal events"
 
-                if 'T' in fact_date_str:
-                    fact_date = datetime.fromisoformat(fact_date_str.replace('Z', '+00:00'))
-                else:
-                    fact_date = datetime.fromisoformat(fact_date_str)
+                fact_date = datetime.fromisoformat(fact_date_str)
 
                 assert fact_date.year == 2023, "Year should be 2023"
                 assert fact_date.month == 8, "Month should be August"
@@ -518,10 +515,7 @@ It was a beautiful day and I plan to make this a regular habit.
         if facts_with_date:
             jogging_fact = facts_with_date[0]
             fact_date_str = jogging_fact.occurred_start
-            if 'T' in fact_date_str:
-                fact_date = datetime.fromisoformat(fact_date_str.replace('Z', '+00:00'))
-            else:
-                fact_date = datetime.fromisoformat(fact_date_str)
+            fact_date = datetime.fromisoformat(fact_date_str)
 
             assert fact_date.year == 2024, "Year should be 2024"
             assert fact_date.month == 11, "Month should be November"
@@ -245,3 +245,125 @@ async def test_return_usage_with_structured_output():
     print(f"\nStructured output with return_usage=True:")
     print(f"  result: {result}")
     print(f"  usage: {usage}")
+
+
+def test_anthropic_system_prompt_marked_for_caching():
+    """Test that the Anthropic system prompt is sent as one cacheable text block."""
+    from hindsight_api.engine.providers.anthropic_llm import _cached_system
+
+    assert _cached_system("You extract facts.") == [
+        {"type": "text", "text": "You extract facts.", "cache_control": {"type": "ephemeral"}}
+    ]
+
+
+@pytest.mark.parametrize(
+    "base_url,expected",
+    [
+        ("", True),
+        (None, True),
+        ("https://api.anthropic.com", True),
+        ("https://api.anthropic.com/v1/", True),
+        ("https://llm-gateway.example.com/anthropic", False),
+        ("http://localhost:4000", False),
+    ],
+)
+def test_anthropic_prompt_caching_only_on_native_api(base_url, expected):
+    """Test that only Anthropic's own API is treated as accepting prompt caching markers."""
+    from hindsight_api.engine.providers.anthropic_llm import _is_native_anthropic_api
+
+    assert _is_native_anthropic_api(base_url) is expected
+
+
+def test_anthropic_prompt_tokens_include_cache_usage():
+    """Test that Anthropic prompt tokens add cache writes and reads to uncached input tokens."""
+    from types import SimpleNamespace
+
+    from hindsight_api.engine.providers.anthropic_llm import _prompt_tokens
+
+    with_cache = SimpleNamespace(input_tokens=20, cache_creation_input_tokens=1500, cache_read_input_tokens=3000)
+    assert _prompt_tokens(with_cache) == 4520
+
+    # Cache fields present but unset (no caching on this call)
+    unset_cache = SimpleNamespace(input_tokens=120, cache_creation_input_tokens=None, cache_read_input_tokens=None)
+    assert _prompt_tokens(unset_cache) == 120
+
+    # Older SDK usage objects without the cache fields
+    without_cache = SimpleNamespace(input_tokens=120)
+    assert _prompt_tokens(without_cache) == 120
+
+    assert _prompt_tokens(None) == 0
+
+
+@pytest.mark.asyncio
+async def test_anthropic_call_records_cached_prompt_tokens():
+    """Test that an Anthropic call sends a cached system block and records total prompt tokens."""
+    from types import SimpleNamespace
+    from unittest.mock import AsyncMock
+
+    from hindsight_api.engine.providers.anthropic_llm import AnthropicLLM
+
+    llm = AnthropicLLM(provider="anthropic", api_key="test-key", base_url="", model="claude-sonnet-4-20250514")
+    response = SimpleNamespace(
+        content=[SimpleNamespace(type="text", text="4")],
+        usage=SimpleNamespace(
+            input_tokens=12, output_tokens=1, cache_creation_input_tokens=0, cache_read_input_tokens=2048
+        ),
+        stop_reason="end_turn",
+    )
+    llm._client.messages.create = AsyncMock(return_value=response)
+    mock_collector = MagicMock(spec=MetricsCollector)
+
+    with patch("hindsight_api.engine.providers.anthropic_llm.get_metrics_collector", return_value=mock_collector):
+        result, usage = await llm.call(
+            messages=[
+                {"role": "system", "content": "You are a helpful assistant."},
+                {"role": "user", "content": "What is 2+2? Reply with just the number."},
+            ],
+            max_completion_tokens=10,
+            return_usage=True,
+        )
+
+    assert result == "4"
+    sent_system = llm._client.messages.create.call_args.kwargs["system"]
+    assert sent_system == [
+        {"type": "text", "text": "You are a helpful assistant.", "cache_control": {"type": "ephemeral"}}
+    ]
+    assert mock_collector.record_llm_call.call_args.kwargs["input_tokens"] == 2060
+    assert usage.input_tokens == 2060
+    assert usage.total_tokens == 2061
+
+
+@pytest.mark.asyncio
+async def test_anthropic_call_sends_plain_system_prompt_to_gateway():
+    """Test that a custom gateway base_url gets the system prompt as a plain string, without cache markers."""
+    from types import SimpleNamespace
+    from unittest.mock import AsyncMock
+
+    from hindsight_api.engine.providers.anthropic_llm import AnthropicLLM
+
+    llm = AnthropicLLM(
+        provider="anthropic",
+        api_key="test-key",
+        base_url="https://llm-gateway.example.com/anthropic",
+        model="claude-sonnet-4-20250514",
+    )
+    response = SimpleNamespace(
+        content=[SimpleNamespace(type="text", text="4")],
+        usage=SimpleNamespace(input_tokens=12, output_tokens=1),
+        stop_reason="end_turn",
+    )
+    llm._client.messages.create = AsyncMock(return_value=response)
+
+    with patch("hindsight_api.engine.providers.anthropic_llm.get_metrics_collector", return_value=MagicMock()):
+        result, usage = await llm.call(
+            messages=[
+                {"role": "system", "content": "You are a helpful assistant."},
+                {"role": "user", "content": "What is 2+2? Reply with just the number."},
+            ],
+            max_completion_tokens=10,
+            return_usage=True,
+        )
+
+    assert result == "4"
+    assert llm._client.messages.create.call_args.kwargs["system"] == "You are a helpful assistant."
+    assert usage.input_tokens == 12
@@ -5,19 +5,12 @@ import pytest
 
 
 @pytest.mark.asyncio
-async def test_reflect_creates_child_spans(memory, request_context):
+async def test_reflect_creates_child_spans(tracing, memory, request_context):
     """Test that reflect operation creates child LLM spans."""
     from datetime import datetime, timezone
-    from hindsight_api.tracing import initialize_tracing, get_span_recorder, create_span_recorder
+    from hindsight_api.tracing import get_span_recorder, create_span_recorder
 
-    # Initialize tracing with a mock endpoint
-    initialize_tracing(
-        service_name="test-hindsight",
-        endpoint="http://localhost:4318",
-        deployment_environment="test"
-    )
-
-    # Create span recorder
+    # Create span recorder (tracing itself is initialized once per session)
     recorder = create_span_recorder()
 
     bank_id = f"test-reflect-hierarchy-{datetime.now(timezone.utc).timestamp()}"
@@ -4,6 +4,7 @@ from datetime import datetime, timezone, timedelta
 import pytest
 from hindsight_api.engine.memory_engine import Budget
 from hindsight_api import RequestContext
+from hindsight_api.engine.search.retrieval import _get_best_timestamp, _temporal_proximity
 
 
 @pytest.mark.asyncio
@@ -138,3 +139,32 @@ async def test_temporal_ranges_are_written(memory, request_context):
 
     # Clean up
     await memory.delete_bank(bank_id, request_context=request_context)
+
+
+def test_best_timestamp_priority():
+    """Temporal scoring timestamp prefers the occurred range midpoint, then its bounds, then mentioned_at."""
+    start = datetime(2024, 2, 1, tzinfo=timezone.utc)
+    end = datetime(2024, 2, 29, tzinfo=timezone.utc)
+    mentioned = datetime(2024, 11, 17, tzinfo=timezone.utc)
+
+    assert _get_best_timestamp(
+        {"occurred_start": start, "occurred_end": end, "mentioned_at": mentioned}
+    ) == (start + (end - start) / 2).timestamp()
+    assert _get_best_timestamp({"occurred_start": start, "occurred_end": None, "mentioned_at": mentioned}) == start.timestamp()
+    assert _get_best_timestamp({"occurred_start": None, "occurred_end": end, "mentioned_at": mentioned}) == end.timestamp()
+    assert _get_best_timestamp({"occurred_start": None, "occurred_end": None, "mentioned_at": mentioned}) == mentioned.timestamp()
+    assert _get_best_timestamp({"occurred_start": None, "occurred_end": None, "mentioned_at": None}) is None
+
+
+def test_temporal_proximity_scoring():
+    """Proximity is 1.0 at the window midpoint, 0.0 at or beyond the edges, and `default` for undated rows."""
+    start_ts = datetime(2024, 2, 1, tzinfo=timezone.utc).timestamp()
+    end_ts = datetime(2024, 2, 29, tzinfo=timezone.utc).timestamp()
+    mid_ts = (start_ts + end_ts) / 2
+    half_window_days = (end_ts - start_ts) / 86400 / 2
+
+    assert _temporal_proximity(mid_ts, mid_ts, half_window_days, default=0.5) == 1.0
+    assert _temporal_proximity(end_ts, mid_ts, half_window_days, default=0.5) == 0.0
+    assert _temporal_proximity(end_ts + 86400 * 30, mid_ts, half_window_days, default=0.5) == 0.0
+    assert _temporal_proximity(None, mid_ts, half_window_days, default=0.3) == 0.3
+    assert _temporal_proximity(start_ts, start_ts, 0.0, default=0.5) == 1.0
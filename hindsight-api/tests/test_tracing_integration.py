@@ -11,14 +11,28 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 
+@pytest.fixture(scope="module")
+def _shared_operation_span():
+    """A single context-manager mock reused by every test in this module."""
+    span = MagicMock()
+    span.__enter__.return_value = span
+    span.__exit__.return_value = False
+    return span
+
+
+@pytest.fixture
+def operation_span(_shared_operation_span):
+    """The shared operation span mock with call history cleared for this test."""
+    _shared_operation_span.reset_mock()
+    return _shared_operation_span
+
+
 @pytest.mark.asyncio
 @patch("hindsight_api.engine.memory_engine.create_operation_span")
-async def test_retain_creates_parent_span(mock_create_span, memory, request_context):
+async def test_retain_creates_parent_span(mock_create_span, operation_span, memory, request_context):
     """Test that retain operation creates a parent span."""
     # Setup
-    mock_span = MagicMock()
-    mock_span.__enter__ = MagicMock(return_value=mock_span)
-    mock_span.__exit__ = MagicMock(return_value=False)
+    mock_span = operation_span
     mock_create_span.return_value = mock_span
 
     bank_id = f"test-retain-{datetime.now(timezone.utc).timestamp()}"
@@ -48,12 +62,10 @@ async def test_retain_creates_parent_span(mock_create_span, memory, request_cont
 
 @pytest.mark.asyncio
 @patch("hindsight_api.engine.memory_engine.create_operation_span")
-async def test_consolidation_creates_parent_span(mock_create_span, memory, request_context):
+async def test_consolidation_creates_parent_span(mock_create_span, operation_span, memory, request_context):
     """Test that consolidation operation creates a parent span."""
     # Setup
-    mock_span = MagicMock()
-    mock_span.__enter__ = MagicMock(return_value=mock_span)
-    mock_span.__exit__ = MagicMock(return_value=False)
+    mock_span = operation_span
     mock_create_span.return_value = mock_span
 
     bank_id = f"test-consolidation-{datetime.now(timezone.utc).timestamp()}"
@@ -81,12 +93,10 @@ async def test_consolidation_creates_parent_span(mock_create_span, memory, reque
 
 @pytest.mark.asyncio
 @patch("hindsight_api.engine.memory_engine.create_operation_span")
-async def test_reflect_creates_parent_span(mock_create_span, memory, request_context):
+async def test_reflect_creates_parent_span(mock_create_span, operation_span, memory, request_context):
     """Test that reflect operation creates a parent span."""
     # Setup
-    mock_span = MagicMock()
-    mock_span.__enter__ = MagicMock(return_value=mock_span)
-    mock_span.__exit__ = MagicMock(return_value=False)
+    mock_span = operation_span
     mock_create_span.return_value = mock_span
 
     bank_id = f"test-reflect-{datetime.now(timezone.utc).timestamp()}"
@@ -126,12 +136,10 @@ async def test_reflect_creates_parent_span(mock_create_span, memory, request_con
 
 @pytest.mark.asyncio
 @patch("hindsight_api.engine.memory_engine.create_operation_span")
-async def test_retain_batch_creates_single_parent_span(mock_create_span, memory, request_context):
+async def test_retain_batch_creates_single_parent_span(mock_create_span, operation_span, memory, request_context):
     """Test that batch retain creates one parent span for the entire batch."""
     # Setup
-    mock_span = MagicMock()
-    mock_span.__enter__ = MagicMock(return_value=mock_span)
-    mock_span.__exit__ = MagicMock(return_value=False)
+    mock_span = operation_span
     mock_create_span.return_value = mock_span
 
     bank_id = f"test-batch-{datetime.now(timezone.utc).timestamp()}"
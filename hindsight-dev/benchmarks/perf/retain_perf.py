@@ -19,8 +19,11 @@ import argparse
 import asyncio
 import json
 import os
+import re
+import statistics
 import sys
 import time
+import uuid
 from pathlib import Path
 from typing import Any
 
@@ -30,62 +33,169 @@ from rich.table import Table
 
 console = Console()
 
+# Matches documents whose top-level JSON value is an object
+_JSON_OBJECT_START_RE = re.compile(r"\s*\{")
+
+# Shared HTTP client so the health check and retain requests reuse pooled connections
+_client: httpx.AsyncClient | None = None
+
+
+def _get_client(timeout: float = 300.0) -> httpx.AsyncClient:
+    """Return the shared HTTP client, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        )
+    return _client
+
+
+# Optional aiohttp session, used instead of httpx with --client aiohttp
+_aiohttp_session: Any = None
+
+
+def _get_aiohttp_session(timeout: float = 300.0) -> Any:
+    """Return the shared aiohttp session, creating it on first use."""
+    global _aiohttp_session
+    if _aiohttp_session is None:
+        import aiohttp
+
+        _aiohttp_session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=timeout),
+            connector=aiohttp.TCPConnector(limit=100, keepalive_timeout=60),
+        )
+    return _aiohttp_session
+
+
+# Shared MemoryEngine for --in-memory mode, initialized once per run
+_engine: Any = None
+
+
+async def _get_engine() -> Any:
+    """Return the shared MemoryEngine, creating and initializing it on first use."""
+    global _engine
+    if _engine is None:
+        from hindsight_api import MemoryEngine
+
+        engine = MemoryEngine(
+            db_url=os.getenv("HINDSIGHT_API_DATABASE_URL", "pg0"),
+            memory_llm_provider=os.getenv("HINDSIGHT_API_LLM_PROVIDER", "groq"),
+            memory_llm_api_key=os.getenv("HINDSIGHT_API_LLM_API_KEY"),
+            memory_llm_model=os.getenv("HINDSIGHT_API_LLM_MODEL", "openai/gpt-oss-20b"),
+            memory_llm_base_url=os.getenv("HINDSIGHT_API_LLM_BASE_URL") or None,
+        )
+        await engine.initialize()
+        _engine = engine
+    return _engine
+
+
+async def _cleanup() -> None:
+    """Close the shared HTTP clients and MemoryEngine if they were created."""
+    global _client, _aiohttp_session, _engine
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+    if _aiohttp_session is not None:
+        await _aiohttp_session.close()
+        _aiohttp_session = None
+    if _engine is not None:
+        await _engine.close()
+        _engine = None
+
 
 async def retain_via_memory_engine(
     bank_id: str,
     items: list[dict[str, Any]],
-) -> tuple[float, dict[str, Any]]:
+) -> tuple[int, dict[str, Any]]:
     """
     Send retain request directly to MemoryEngine (in-memory, no HTTP).
 
+    The engine is shared across calls, so only the first call pays for initialization,
+    and that cost is never included in the measured duration.
+
     Args:
         bank_id: Bank ID to retain into
         items: List of items to retain
 
     Returns:
-        Tuple of (duration_seconds, response_data)
+        Tuple of (duration_ns, response_data)
     """
-    from hindsight_api import MemoryEngine
     from hindsight_api.models import RequestContext
 
-    # Initialize memory engine
-    memory = MemoryEngine(
-        db_url=os.getenv("HINDSIGHT_API_DATABASE_URL", "pg0"),
-        memory_llm_provider=os.getenv("HINDSIGHT_API_LLM_PROVIDER", "groq"),
-        memory_llm_api_key=os.getenv("HINDSIGHT_API_LLM_API_KEY"),
-        memory_llm_model=os.getenv("HINDSIGHT_API_LLM_MODEL", "openai/gpt-oss-20b"),
-        memory_llm_base_url=os.getenv("HINDSIGHT_API_LLM_BASE_URL") or None,
-    )
-    await memory.initialize()
+    memory = await _get_engine()
 
     # Measure time
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
+
+    # Call retain_batch_async directly
+    result, usage = await memory.retain_batch_async(
+        bank_id=bank_id,
+        contents=items,
+        request_context=RequestContext(),
+        return_usage=True,
+    )
 
-    try:
-        # Call retain_batch_async directly
-        result, usage = await memory.retain_batch_async(
-            bank_id=bank_id,
-            contents=items,
-            request_context=RequestContext(),
-            return_usage=True,
-        )
+    duration_ns = time.perf_counter_ns() - start_ns
 
-        duration = time.time() - start_time
+    # Format response to match HTTP response structure
+    response_data = {
+        "success": True,
+        "bank_id": bank_id,
+        "items_count": len(items),
+        "async": False,
+        "usage": usage.model_dump() if usage else None,
+    }
 
-        # Format response to match HTTP response structure
-        response_data = {
-            "success": True,
-            "bank_id": bank_id,
-            "items_count": len(items),
-            "async": False,
-            "usage": usage.model_dump() if usage else None,
-        }
+    return duration_ns, response_data
 
-        return duration, response_data
-    finally:
-        # Close memory engine connections
-        pool = await memory._get_pool()
-        await pool.close()
+
+async def delete_bank(bank_id: str, base_url: str, in_memory: bool, timeout: float) -> None:
+    """Delete a bank and all of its data, via MemoryEngine or the HTTP API."""
+    if in_memory:
+        from hindsight_api.models import RequestContext
+
+        memory = await _get_engine()
+        await memory.delete_bank(bank_id, request_context=RequestContext())
+        return
+    response = await _get_client(timeout).delete(f"{base_url}/v1/default/banks/{bank_id}")
+    response.raise_for_status()
+
+
+async def _post_retain(
+    url: str,
+    items: list[dict[str, Any]],
+    timeout: float,
+    client_kind: str,
+) -> dict[str, Any]:
+    """POST one retain request and return the parsed response."""
+    payload = {"items": items}
+    headers = {"Content-Type": "application/json"}
+
+    if client_kind == "aiohttp":
+        session = _get_aiohttp_session(timeout)
+        async with session.post(url, json=payload, headers=headers) as resp:
+            resp.raise_for_status()
+            return await resp.json()
+
+    client = _get_client(timeout)
+    response = await client.post(url, json=payload, headers=headers, timeout=timeout)
+    response.raise_for_status()
+    return response.json()
+
+
+def _merge_responses(responses: list[dict[str, Any]]) -> dict[str, Any]:
+    """Fold several retain responses into one, summing item counts and token usage."""
+    merged = dict(responses[0])
+    merged["success"] = all(r.get("success", False) for r in responses)
+    merged["items_count"] = sum(r.get("items_count", 0) for r in responses)
+
+    usages = [r["usage"] for r in responses if r.get("usage")]
+    if usages:
+        merged["usage"] = {
+            key: sum(u.get(key, 0) for u in usages) for key in ("input_tokens", "output_tokens", "total_tokens")
+        }
+    return merged
 
 
 async def retain_via_http(
@@ -93,43 +203,61 @@ async def retain_via_http(
     bank_id: str,
     items: list[dict[str, Any]],
     timeout: float = 300.0,
-) -> tuple[float, dict[str, Any]]:
+    client_kind: str = "httpx",
+    batch_size: int = 0,
+    max_concurrency: int = 16,
+) -> tuple[int, dict[str, Any]]:
     """
-    Send retain request via HTTP and measure performance.
+    Send retain request(s) via HTTP and measure performance.
 
     Args:
         base_url: API base URL (e.g., http://localhost:8000)
         bank_id: Bank ID to retain into
         items: List of items to retain (each with 'content' and optional 'context', 'metadata')
         timeout: Request timeout in seconds
+        client_kind: HTTP client library to send the request with ("httpx" or "aiohttp")
+        batch_size: Items per request; 0 sends all items in a single request
+        max_concurrency: Maximum number of requests in flight when batching
 
     Returns:
-        Tuple of (duration_seconds, response_data)
+        Tuple of (duration_ns, response_data)
+        response_data also includes 'request_durations_ns' with the latency of each request
     """
     url = f"{base_url}/v1/default/banks/{bank_id}/memories"
 
-    payload = {"items": items}
+    if batch_size > 0:
+        batches = [items[i : i + batch_size] for i in range(0, len(items), batch_size)]
+    else:
+        batches = [items]
 
-    headers = {"Content-Type": "application/json"}
+    semaphore = asyncio.Semaphore(max_concurrency)
+    request_durations_ns: list[int] = []
+
+    async def _send(batch: list[dict[str, Any]]) -> dict[str, Any]:
+        async with semaphore:
+            request_start_ns = time.perf_counter_ns()
+            response = await _post_retain(url, batch, timeout, client_kind)
+            request_durations_ns.append(time.perf_counter_ns() - request_start_ns)
+            return response
 
     # Measure time
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
 
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        response = await client.post(url, json=payload, headers=headers)
-        response.raise_for_status()
-        result = response.json()
+    responses = await asyncio.gather(*(_send(batch) for batch in batches))
 
-    duration = time.time() - start_time
+    duration_ns = time.perf_counter_ns() - start_ns
 
-    return duration, result
+    result = _merge_responses(responses) if len(responses) > 1 else responses[0]
+    result["request_durations_ns"] = request_durations_ns
 
+    return duration_ns, result
 
-def load_documents(path: str) -> tuple[list[dict[str, Any]], int]:
+
+async def load_documents(path: str, max_concurrency: int = 32) -> tuple[list[dict[str, Any]], int]:
     """
     Load document(s) from file or directory.
 
-    For directories: loads all .json, .txt, and .md files
+    For directories: loads all .json, .txt, and .md files concurrently in worker threads
     For JSON files with 'content' field: extracts content
     For other files: reads entire file as content
 
@@ -143,40 +271,48 @@ def load_documents(path: str) -> tuple[list[dict[str, Any]], int]:
         raise FileNotFoundError(f"Path not found: {path}")
 
     items = []
-    total_length = 0
 
     if file_path.is_file():
         # Single file
         content, metadata = _load_single_file(file_path)
-        total_length = len(content)
         item = {"content": content}
         if metadata:
             item["metadata"] = metadata
         items.append(item)
     else:
         # Directory - load all supported files
-        supported_extensions = {".json", ".txt", ".md"}
-        files = [f for f in file_path.rglob("*") if f.is_file() and f.suffix in supported_extensions]
+        supported_extensions = (".json", ".txt", ".md")
+        files = sorted(
+            f for ext in supported_extensions for f in file_path.rglob(f"*{ext}") if f.is_file() and f.suffix == ext
+        )
 
         if not files:
             raise ValueError(f"No supported files (.json, .txt, .md) found in directory: {path}")
 
         console.print(f"Found {len(files)} files in directory")
 
-        for file in sorted(files):
-            try:
-                content, metadata = _load_single_file(file)
-                total_length += len(content)
-                item = {"content": content}
-                if metadata:
-                    item["metadata"] = metadata
-                # Add filename as context for batch processing
-                item["context"] = f"Source: {file.name}"
-                items.append(item)
-            except Exception as e:
-                console.print(f"[yellow]Warning: Failed to load {file.name}: {e}[/yellow]")
-                continue
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _bounded_load(file: Path) -> tuple[str, dict[str, Any] | None]:
+            async with semaphore:
+                return await asyncio.to_thread(_load_single_file, file)
+
+        # gather preserves input order, so items stay sorted by path
+        results = await asyncio.gather(*(_bounded_load(f) for f in files), return_exceptions=True)
 
+        for file, result in zip(files, results):
+            if isinstance(result, Exception):
+                console.print(f"[yellow]Warning: Failed to load {file.name}: {result}[/yellow]")
+                continue
+            content, metadata = result
+            item = {"content": content}
+            if metadata:
+                item["metadata"] = metadata
+            # Add filename as context for batch processing
+            item["context"] = f"Source: {file.name}"
+            items.append(item)
+
+    total_length = sum(len(item["content"]) for item in items)
     return items, total_length
 
 
@@ -187,59 +323,121 @@ def _load_single_file(file_path: Path) -> tuple[str, dict[str, Any] | None]:
     Returns:
         Tuple of (content, metadata)
     """
-    if file_path.suffix == ".json":
+    text = file_path.read_text()
+    if file_path.suffix == ".json" and _JSON_OBJECT_START_RE.match(text):
         # Try to parse as JSON and extract 'content' field
         try:
-            data = json.loads(file_path.read_text())
-            if isinstance(data, dict) and "content" in data:
-                # Extract metadata if present
-                metadata = data.get("metadata", {})
-                # Add doc_id to metadata if present
-                if "doc_id" in data:
-                    metadata["doc_id"] = data["doc_id"]
-                return data["content"], metadata if metadata else None
-            else:
-                # Fallback: use entire JSON as string
-                return file_path.read_text(), None
+            data = json.loads(text)
         except json.JSONDecodeError:
-            # Not valid JSON, read as text
-            return file_path.read_text(), None
+            # Not valid JSON, use as text
+            return text, None
+        # The leading '{' check guarantees a dict here, so only a missing key can fail
+        try:
+            content = data["content"]
+        except KeyError:
+            return text, None
+        # Extract metadata if present
+        metadata = data.get("metadata", {})
+        # Add doc_id to metadata if present
+        if "doc_id" in data:
+            metadata["doc_id"] = data["doc_id"]
+        return content, metadata if metadata else None
+    # Plain text, or JSON without a top-level 'content' field: use entire file as string
+    return text, None
+
+
+def _latency_stats(durations_ns: list[int]) -> dict[str, float]:
+    """Summarize per-request latencies (nanoseconds) with percentiles and spread."""
+    if len(durations_ns) > 1:
+        percentiles = statistics.quantiles(durations_ns, n=100, method="inclusive")
+        p50, p95, p99 = percentiles[49], percentiles[94], percentiles[98]
+        stdev = statistics.stdev(durations_ns)
     else:
-        # Read as plain text
-        return file_path.read_text(), None
+        p50 = p95 = p99 = durations_ns[0]
+        stdev = 0.0
+    return {
+        "p50": p50,
+        "p95": p95,
+        "p99": p99,
+        "min": min(durations_ns),
+        "max": max(durations_ns),
+        "mean": statistics.fmean(durations_ns),
+        "stdev": stdev,
+    }
 
 
-def display_results(
-    duration: float,
+def build_results(
+    duration_ns: int,
     usage: dict[str, int] | None,
     content_length: int,
     bank_id: str,
+    document_path: str,
     num_documents: int,
-) -> None:
-    """Display benchmark results in a formatted table."""
+    request_durations_ns: list[int] | None = None,
+) -> dict[str, Any]:
+    """Build the machine-readable results dict."""
+    duration = duration_ns / 1e9
+    results = {
+        "bank_id": bank_id,
+        "document_path": document_path,
+        "num_documents": num_documents,
+        "content_length": content_length,
+        "avg_content_per_doc": content_length / num_documents if num_documents > 0 else 0,
+        "duration_seconds": duration,
+        "duration_ns": duration_ns,
+        "chars_per_second": content_length / duration,
+        "docs_per_second": num_documents / duration if num_documents > 0 else 0,
+        "usage": usage,
+    }
+
+    if usage:
+        total_tokens = usage.get("total_tokens", 0)
+        results["tokens_per_second"] = total_tokens / duration
+        results["avg_tokens_per_doc"] = total_tokens / num_documents if num_documents > 0 else 0
+
+    if request_durations_ns:
+        results["num_requests"] = len(request_durations_ns)
+        results["request_durations_ns"] = request_durations_ns
+        results["latency_ns"] = _latency_stats(request_durations_ns)
+
+    return results
+
+
+def display_results(results: dict[str, Any]) -> None:
+    """Display benchmark results (as produced by build_results) in a formatted table."""
+    num_documents = results["num_documents"]
+    usage = results["usage"]
+
     table = Table(title="Retain Performance Benchmark Results")
     table.add_column("Metric", style="cyan")
     table.add_column("Value", style="green")
 
-    table.add_row("Bank ID", bank_id)
+    table.add_row("Bank ID", results["bank_id"])
     table.add_row("Documents", f"{num_documents:,}")
-    table.add_row("Total Content Length", f"{content_length:,} chars")
+    table.add_row("Total Content Length", f"{results['content_length']:,} chars")
     if num_documents > 1:
-        table.add_row("Avg Content/Doc", f"{content_length / num_documents:,.0f} chars")
+        table.add_row("Avg Content/Doc", f"{results['avg_content_per_doc']:,.0f} chars")
     table.add_row("", "")  # Separator
-    table.add_row("Duration", f"{duration:.3f}s")
-    table.add_row("Throughput", f"{content_length / duration:,.0f} chars/sec")
+    table.add_row("Duration", f"{results['duration_seconds']:.3f}s")
+    table.add_row("Throughput", f"{results['chars_per_second']:,.0f} chars/sec")
     if num_documents > 1:
-        table.add_row("Docs/Second", f"{num_documents / duration:.2f}")
+        table.add_row("Docs/Second", f"{results['docs_per_second']:.2f}")
+    if results.get("num_requests", 0) > 1:
+        latency = results["latency_ns"]
+        table.add_row("Requests", f"{results['num_requests']:,}")
+        table.add_row(
+            "Request Latency p50/p95/p99",
+            f"{latency['p50'] / 1e9:.3f}s / {latency['p95'] / 1e9:.3f}s / {latency['p99'] / 1e9:.3f}s",
+        )
 
     if usage:
         table.add_row("", "")  # Separator
         table.add_row("Input Tokens", f"{usage.get('input_tokens', 0):,}")
         table.add_row("Output Tokens", f"{usage.get('output_tokens', 0):,}")
         table.add_row("Total Tokens", f"{usage.get('total_tokens', 0):,}")
-        table.add_row("Tokens/Second", f"{usage.get('total_tokens', 0) / duration:,.1f}")
+        table.add_row("Tokens/Second", f"{results['tokens_per_second']:,.1f}")
         if num_documents > 1:
-            table.add_row("Avg Tokens/Doc", f"{usage.get('total_tokens', 0) / num_documents:,.0f}")
+            table.add_row("Avg Tokens/Doc", f"{results['avg_tokens_per_doc']:,.0f}")
     else:
         table.add_row("", "")  # Separator
         table.add_row("Token Usage", "Not available (async mode or error)")
@@ -248,32 +446,8 @@ def display_results(
     console.print(table)
 
 
-def save_results(
-    output_path: Path,
-    duration: float,
-    usage: dict[str, int] | None,
-    content_length: int,
-    bank_id: str,
-    document_path: str,
-    num_documents: int,
-) -> None:
+def save_results(output_path: Path, results: dict[str, Any]) -> None:
     """Save results to JSON file."""
-    results = {
-        "bank_id": bank_id,
-        "document_path": document_path,
-        "num_documents": num_documents,
-        "content_length": content_length,
-        "avg_content_per_doc": content_length / num_documents if num_documents > 0 else 0,
-        "duration_seconds": duration,
-        "chars_per_second": content_length / duration,
-        "docs_per_second": num_documents / duration if num_documents > 0 else 0,
-        "usage": usage,
-    }
-
-    if usage:
-        results["tokens_per_second"] = usage.get("total_tokens", 0) / duration
-        results["avg_tokens_per_doc"] = usage.get("total_tokens", 0) / num_documents if num_documents > 0 else 0
-
     with open(output_path, "w") as f:
         json.dump(results, f, indent=2)
 
@@ -337,6 +511,35 @@ Examples:
         type=Path,
         help="Path to save results JSON (optional)",
     )
+    parser.add_argument(
+        "--client",
+        choices=["httpx", "aiohttp"],
+        default="httpx",
+        help="HTTP client library used for the retain request (default: httpx)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=0,
+        help="Split directory items into requests of this many items (default: 0, a single request)",
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=16,
+        help="Maximum concurrent retain requests when --batch-size is set (default: 16)",
+    )
+    parser.add_argument(
+        "--warmup",
+        type=int,
+        default=0,
+        help="Number of discarded retain runs, into a throwaway bank, before the measured one (default: 0)",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print results as JSON on stdout instead of a table (progress output goes to stderr)",
+    )
     parser.add_argument(
         "--in-memory",
         action="store_true",
@@ -345,6 +548,10 @@ Examples:
 
     args = parser.parse_args()
 
+    if args.json:
+        # Keep stdout clean for the JSON results
+        console.file = sys.stderr
+
     console.print("\n[bold cyan]Retain Performance Benchmark[/bold cyan]")
     console.print("=" * 80)
 
@@ -358,9 +565,8 @@ Examples:
     if not args.in_memory:
         console.print(f"\n[1] Checking API server at {args.api_url}...")
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(f"{args.api_url}/health", timeout=5.0)
-                response.raise_for_status()
+            response = await _get_client(args.timeout).get(f"{args.api_url}/health", timeout=5.0)
+            response.raise_for_status()
             console.print("    [green]✓[/green] API server is running")
         except Exception as e:
             console.print(f"    [red]✗[/red] API server is not accessible: {e}")
@@ -376,7 +582,7 @@ Examples:
         console.print(f"\n[2] Loading document from {args.document}...")
 
     try:
-        items, total_content_length = load_documents(args.document)
+        items, total_content_length = await load_documents(args.document)
         num_docs = len(items)
 
         # Add context to single file if provided
@@ -397,22 +603,39 @@ Examples:
     # Run benchmark
     console.print(f"\n[3] {'Processing' if args.in_memory else 'Sending retain request to'} bank '{args.bank_id}'...")
     console.print(f"    [cyan]Retaining {num_docs:,} document{'s' if num_docs > 1 else ''} in batch...[/cyan]")
-    try:
+
+    async def _retain(bank_id: str) -> tuple[int, dict[str, Any]]:
         if args.in_memory:
             # In-memory mode: call MemoryEngine directly
-            duration, result = await retain_via_memory_engine(
-                bank_id=args.bank_id,
-                items=items,
-            )
-        else:
-            # HTTP mode: call API endpoint
-            duration, result = await retain_via_http(
-                base_url=args.api_url,
-                bank_id=args.bank_id,
+            return await retain_via_memory_engine(
+                bank_id=bank_id,
                 items=items,
-                timeout=args.timeout,
             )
-        console.print(f"    [green]✓[/green] Retain completed in {duration:.3f}s")
+        # HTTP mode: call API endpoint
+        return await retain_via_http(
+            base_url=args.api_url,
+            bank_id=bank_id,
+            items=items,
+            timeout=args.timeout,
+            client_kind=args.client,
+            batch_size=args.batch_size,
+            max_concurrency=args.max_concurrency,
+        )
+
+    try:
+        if args.warmup:
+            # Warm up against a throwaway bank so the measured run doesn't retain
+            # into a bank that already holds the same documents
+            warmup_bank_id = f"{args.bank_id}-warmup-{uuid.uuid4().hex[:8]}"
+            try:
+                for i in range(args.warmup):
+                    warmup_ns, _ = await _retain(warmup_bank_id)
+                    console.print(f"    [dim]Warmup {i + 1}/{args.warmup} completed in {warmup_ns / 1e9:.3f}s[/dim]")
+            finally:
+                await delete_bank(warmup_bank_id, args.api_url, args.in_memory, args.timeout)
+
+        duration_ns, result = await _retain(args.bank_id)
+        console.print(f"    [green]✓[/green] Retain completed in {duration_ns / 1e9:.3f}s")
 
         # Extract usage
         usage = result.get("usage")
@@ -425,32 +648,38 @@ Examples:
         console.print(f"    [red]✗[/red] Request failed: {e}")
         sys.exit(1)
 
-    # Display results
-    console.print("\n[4] Results:")
-    display_results(
-        duration=duration,
+    results = build_results(
+        duration_ns=duration_ns,
         usage=usage,
         content_length=total_content_length,
         bank_id=args.bank_id,
+        document_path=args.document,
         num_documents=num_docs,
+        request_durations_ns=result.get("request_durations_ns"),
     )
 
+    # Display results
+    if args.json:
+        sys.stdout.write(json.dumps(results) + "\n")
+    else:
+        console.print("\n[4] Results:")
+        display_results(results)
+
     # Save results if requested
     if args.output:
         console.print("\n[5] Saving results...")
         args.output.parent.mkdir(parents=True, exist_ok=True)
-        save_results(
-            output_path=args.output,
-            duration=duration,
-            usage=usage,
-            content_length=total_content_length,
-            bank_id=args.bank_id,
-            document_path=args.document,
-            num_documents=num_docs,
-        )
+        save_results(args.output, results)
 
     console.print("\n[bold green]✓ Benchmark Complete![/bold green]\n")
 
 
+async def _run() -> None:
+    try:
+        await main()
+    finally:
+        await _cleanup()
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(_run())
@@ -32,6 +32,10 @@ logging.getLogger("httpx").setLevel(logging.WARNING)
 DAEMON_STARTUP_TIMEOUT = 180  # seconds
 DEFAULT_DAEMON_IDLE_TIMEOUT = 300  # 5 minutes
 
+# Profile names that are already safe for database names and file paths
+_SAFE_PROFILE_RE = re.compile(r"[a-zA-Z0-9_-]*")
+_UNSAFE_PROFILE_CHARS_RE = re.compile(r"[^a-zA-Z0-9_-]")
+
 
 class DaemonEmbedManager(EmbedManager):
     """Production embed manager using daemon-based architecture with profile isolation."""
@@ -44,7 +48,9 @@ class DaemonEmbedManager(EmbedManager):
         """Sanitize profile name for use in database names and file paths."""
         if profile is None:
             return "default"
-        return re.sub(r"[^a-zA-Z0-9_-]", "-", profile)
+        if _SAFE_PROFILE_RE.fullmatch(profile):
+            return profile
+        return _UNSAFE_PROFILE_CHARS_RE.sub("-", profile)
 
     def get_database_url(self, profile: str, db_url: Optional[str] = None) -> str:
         """
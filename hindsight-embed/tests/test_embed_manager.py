@@ -23,6 +23,14 @@ def test_sanitize_profile_name_via_db_url():
     assert manager.get_database_url("My App 2.0!") == "pg0://hindsight-embed-My-App-2-0-"
 
 
+def test_sanitize_empty_profile_name_is_not_default():
+    """Test that an empty profile name is kept distinct from the default profile."""
+    manager = get_embed_manager()
+
+    assert manager.get_database_url("") == "pg0://hindsight-embed-"
+    assert manager.get_database_url("") != manager.get_database_url(None)
+
+
 def test_get_database_url_default():
     """Test database URL generation with default pg0."""
     manager = get_embed_manager()
@@ -125,6 +125,8 @@ from .callbacks import (
     cleanup_callback,
 )
 from .wrappers import (
+    fact_type_label,
+    _reset_recall_breaker,
     recall,
     arecall,
     RecallResult,
@@ -136,6 +138,7 @@ from .wrappers import (
     ReflectDebugInfo,
     retain,
     aretain,
+    retain_batch,
     RetainResult,
     RetainDebugInfo,
     get_pending_retain_errors,
@@ -271,6 +274,8 @@ def _inject_memories(
         )
 
     user_query = custom_query
+    if len(user_query.strip()) < defaults.min_query_length:
+        return messages
 
     # Use bank_id from defaults
     bank_id = defaults.bank_id
@@ -283,8 +288,6 @@ def _inject_memories(
     results_count = 0
     memory_context = ""
 
-    # Create fresh client for this operation (closed in finally block)
-    client = None
     try:
         client = _get_client(config.hindsight_api_url)
 
@@ -416,8 +419,7 @@ def _inject_memories(
                 text = r.text if hasattr(r, "text") else str(r)
                 fact_type = getattr(r, "type", "world")
                 if text:
-                    type_label = fact_type.upper() if fact_type else "MEMORY"
-                    memory_lines.append(f"{i}. [{type_label}] {text}")
+                    memory_lines.append(f"{i}. [{fact_type_label(fact_type)}] {text}")
 
             if not memory_lines:
                 if config.verbose:
@@ -506,13 +508,6 @@ def _inject_memories(
                 error=str(e),
             )
         return messages
-    finally:
-        # Always close the client to avoid "Unclosed client session" warnings
-        if client is not None:
-            try:
-                client.close()
-            except Exception:
-                pass
 
 
 def _wrapped_completion(*args, **kwargs):
@@ -696,7 +691,7 @@ def disable() -> None:
         litellm.acompletion = _original_acompletion
         _original_acompletion = None
 
-    # Close cached HTTP client to avoid "Unclosed client session" warnings
+    # Close this thread's cached HTTP clients to avoid "Unclosed client session" warnings
     _close_client()
 
     _enabled = False
@@ -727,6 +722,7 @@ def cleanup() -> None:
     """
     disable()  # This already calls _close_client()
     cleanup_callback()
+    _reset_recall_breaker()
     reset_config()
 
 
@@ -1318,6 +1314,7 @@ __all__ = [
     "ReflectDebugInfo",
     "retain",
     "aretain",
+    "retain_batch",
     "RetainResult",
     "RetainDebugInfo",
     # Native client wrappers
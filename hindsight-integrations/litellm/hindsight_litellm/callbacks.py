@@ -27,6 +27,7 @@ from .config import (
     MemoryInjectionMode,
     _merge_call_settings,
 )
+from .wrappers import fact_type_label
 
 # Use requests for sync HTTP calls to avoid async event loop issues
 try:
@@ -292,8 +293,7 @@ class HindsightCallback(CustomLogger):
 
             if text:
                 # Include metadata for context
-                type_label = fact_type.upper() if fact_type else "MEMORY"
-                line = f"{i}. [{type_label}] {text}"
+                line = f"{i}. [{fact_type_label(fact_type)}] {text}"
                 if weight > 0 and config.verbose:
                     line += f" (relevance: {weight:.2f})"
                 memory_lines.append(line)
@@ -746,6 +746,8 @@ class HindsightCallback(CustomLogger):
             )
 
         user_query = custom_query
+        if len(user_query.strip()) < settings.min_query_length:
+            return
 
         # Use reflect or recall based on settings
         if settings.use_reflect:
@@ -812,6 +814,8 @@ class HindsightCallback(CustomLogger):
             )
 
         user_query = custom_query
+        if len(user_query.strip()) < settings.min_query_length:
+            return
 
         # Use reflect or recall based on settings
         if settings.use_reflect:
@@ -63,6 +63,10 @@ class HindsightCallSettings:
         max_memories: Maximum memories to inject (None = no limit)
         max_memory_tokens: Maximum tokens for memory context
         include_entities: Include entity observations in recall results
+        min_query_length: Skip memory injection for queries shorter than this
+            many characters (e.g., "hi", "ok"), saving the recall round-trip.
+            0 (default) always injects. With the LiteLLM callback the check
+            applies to hindsight_query.
         trace: Enable trace info for recall debugging
 
         tags: Tags to apply when storing conversations. Use for visibility scoping
@@ -100,6 +104,7 @@ class HindsightCallSettings:
     max_memories: Optional[int] = None  # None = no limit
     max_memory_tokens: int = 4096
     include_entities: bool = True
+    min_query_length: int = 0  # 0 = always inject
     trace: bool = False
 
     # Tags for visibility scoping
@@ -236,6 +241,7 @@ def configure(
     max_memories: Optional[int] = None,
     max_memory_tokens: int = 4096,
     include_entities: bool = True,
+    min_query_length: int = 0,
     trace: bool = False,
     tags: Optional[List[str]] = None,
     recall_tags: Optional[List[str]] = None,
@@ -277,6 +283,7 @@ def configure(
         max_memories: Max memories to inject (None = no limit)
         max_memory_tokens: Max tokens for memory context (default: 4096)
         include_entities: Include entity observations in recall (default: True)
+        min_query_length: Skip memory injection for shorter queries (default: 0)
         trace: Enable trace info for debugging (default: False)
         tags: Tags to apply when storing conversations (e.g., ["user:alice"])
         recall_tags: Tags to filter by when recalling/reflecting memories
@@ -332,6 +339,7 @@ def configure(
         max_memories=max_memories,
         max_memory_tokens=max_memory_tokens,
         include_entities=include_entities,
+        min_query_length=min_query_length,
         trace=trace,
         tags=tags,
         recall_tags=recall_tags,
@@ -377,6 +385,7 @@ def set_defaults(
     max_memories: Optional[int] = None,
     max_memory_tokens: Optional[int] = None,
     include_entities: Optional[bool] = None,
+    min_query_length: Optional[int] = None,
     trace: Optional[bool] = None,
     tags: Optional[List[str]] = None,
     recall_tags: Optional[List[str]] = None,
@@ -406,6 +415,7 @@ def set_defaults(
         max_memories: Max number of memories to inject
         max_memory_tokens: Max tokens for memory context
         include_entities: Include entity observations in recall
+        min_query_length: Skip memory injection for shorter queries
         trace: Enable trace info for debugging
         tags: Tags to apply when storing conversations
         recall_tags: Tags to filter by when recalling/reflecting memories
@@ -457,6 +467,9 @@ def set_defaults(
         include_entities=include_entities
         if include_entities is not None
         else current.include_entities,
+        min_query_length=min_query_length
+        if min_query_length is not None
+        else current.min_query_length,
         trace=trace if trace is not None else current.trace,
         tags=tags if tags is not None else current.tags,
         recall_tags=recall_tags if recall_tags is not None else current.recall_tags,
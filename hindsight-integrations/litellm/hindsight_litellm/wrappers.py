@@ -7,12 +7,18 @@ This is an alternative to the LiteLLM callback approach, providing direct
 integration with native client libraries.
 """
 
+import asyncio
+import atexit
 import logging
 import os
 import threading
+import time
+import warnings
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait as wait_futures
 from dataclasses import dataclass, fields
 from datetime import datetime, timezone
-from typing import Any, Dict, Iterator, List, Optional
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Set
 
 from .config import (
     DEFAULT_BANK_ID,
@@ -25,30 +31,227 @@ from .config import (
 )
 
 # Background thread support for async retain
-_retain_errors: List[Exception] = []
-_retain_errors_lock = threading.Lock()
+# Bounded so a persistently failing server can't grow it without limit;
+# deque.append/popleft are atomic, so no lock is needed.
+_retain_errors: Deque[Exception] = deque(maxlen=1024)
+
+# Worker pool for background retains (retain(sync=False)). Workers are
+# long-lived, so each one keeps reusing its cached Hindsight client.
+HINDSIGHT_RETAIN_WORKERS_ENV = "HINDSIGHT_RETAIN_WORKERS"
+_retain_executor: Optional[ThreadPoolExecutor] = None
+_retain_executor_lock = threading.Lock()
+# Caps queued + running background retains; beyond that retain() fails fast
+# instead of letting the executor's queue grow without bound.
+HINDSIGHT_RETAIN_QUEUE_SIZE_ENV = "HINDSIGHT_RETAIN_QUEUE_SIZE"
+_retain_slots = threading.BoundedSemaphore(
+    int(os.environ.get(HINDSIGHT_RETAIN_QUEUE_SIZE_ENV, 0)) or 512
+)
+# Queued and running background retains, so exit can wait for them.
+_pending_retains: Set[Future] = set()
+_pending_retains_lock = threading.Lock()
+# How long interpreter exit waits for queued background work before dropping it.
+HINDSIGHT_SHUTDOWN_TIMEOUT_ENV = "HINDSIGHT_SHUTDOWN_TIMEOUT"
+
+
+def _get_retain_executor() -> ThreadPoolExecutor:
+    """Get or create the thread pool used for background retains."""
+    global _retain_executor
+    if _retain_executor is None:
+        with _retain_executor_lock:
+            if _retain_executor is None:
+                max_workers = int(os.environ.get(HINDSIGHT_RETAIN_WORKERS_ENV, 0)) or min(
+                    32, (os.cpu_count() or 1) * 5
+                )
+                _retain_executor = ThreadPoolExecutor(
+                    max_workers=max_workers, thread_name_prefix="hindsight-retain"
+                )
+    return _retain_executor
+
 
 logger = logging.getLogger(__name__)
 
+# Sentinel for getattr() lookups where None is a valid attribute value
+_MISSING = object()
+
+
+# Hindsight clients cached per thread, keyed by (api_url, api_key).
+# The sync client runs requests on the calling thread's event loop and its
+# aiohttp session is bound to that loop, so each cached client is tied to the
+# loop it was created on and only reused while that loop is still current.
+_thread_clients = threading.local()
+# Every cached client with its loop, so leftovers can be closed at exit
+_all_clients: List[tuple] = []
+_all_clients_lock = threading.Lock()
+# Close tasks scheduled on a running loop, referenced until they finish
+_closing_tasks: set = set()
+
+
+def _thread_loop() -> asyncio.AbstractEventLoop:
+    """Return the event loop the client will run on in this thread, creating one if needed.
+
+    Worker threads start without a loop; the sync client would install one on
+    its first request, after the client was already created. Setting it up
+    front means the client is bound to the loop it will actually use.
+    """
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", DeprecationWarning)
+            loop = asyncio.get_event_loop()
+    except RuntimeError:
+        loop = None
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+    return loop
+
+
+def _dispose_client(client, loop: asyncio.AbstractEventLoop) -> None:
+    """Close a cached client and drop it from the exit-time registry.
+
+    The session is closed on the loop it was created on (scheduled if that
+    loop is running); if the loop is already closed, the close runs on the
+    current loop or a throwaway one so the session and its connector still
+    release their sockets.
+    """
+    with _all_clients_lock:
+        try:
+            _all_clients.remove((client, loop))
+        except ValueError:
+            pass
+    try:
+        if loop.is_running():
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+        elif not loop.is_closed():
+            loop.run_until_complete(client.aclose())
+        else:
+            try:
+                running = asyncio.get_running_loop()
+            except RuntimeError:
+                running = None
+            if running is not None:
+                task = running.create_task(client.aclose())
+                _closing_tasks.add(task)
+                task.add_done_callback(_closing_tasks.discard)
+            else:
+                closer = asyncio.new_event_loop()
+                try:
+                    closer.run_until_complete(client.aclose())
+                finally:
+                    closer.close()
+    except Exception:
+        pass
+
 
 def _get_client(api_url: str, api_key: Optional[str] = None):
-    """Create a fresh Hindsight client for the given URL.
+    """Get a Hindsight client for the given URL, reused within the calling thread.
 
-    Note: We create a fresh client each time because the hindsight_client
-    uses aiohttp internally, and reusing clients across different sync
-    calls causes asyncio context issues.
+    A new client is created when the thread's event loop has changed (e.g. after
+    asyncio.run() replaced it), since the old client's session is bound to the
+    previous loop; the old client is closed rather than left open.
     """
+    clients = getattr(_thread_clients, "clients", None)
+    if clients is None:
+        clients = _thread_clients.clients = {}
+
+    loop = _thread_loop()
+    key = (api_url, api_key)
+    cached = clients.pop(key, None)
+    if cached is not None:
+        client, client_loop = cached
+        if client_loop is loop:
+            clients[key] = cached
+            return client
+        _dispose_client(client, client_loop)
+
     from hindsight_client import Hindsight
 
-    return Hindsight(base_url=api_url, api_key=api_key, timeout=30.0)
+    client = Hindsight(base_url=api_url, api_key=api_key, timeout=30.0)
+    clients[key] = (client, loop)
+    with _all_clients_lock:
+        _all_clients.append((client, loop))
+    return client
 
 
 def _close_client():
-    """No-op for compatibility. Clients are now closed after each use."""
-    pass
+    """Close the Hindsight clients cached for the calling thread."""
+    clients = getattr(_thread_clients, "clients", None)
+    if not clients:
+        return
+    for client, loop in list(clients.values()):
+        _dispose_client(client, loop)
+    clients.clear()
+
+
+# Circuit breaker for memory recall in the wrapped clients' create() path.
+# After this many consecutive failed (or slow) recalls, recall is skipped
+# for the cooldown window so a degraded Hindsight backend doesn't add its
+# full timeout to every chat turn.
+_RECALL_BREAKER_THRESHOLD = 5
+_RECALL_BREAKER_COOLDOWN_SECONDS = 30.0
+# A recall slower than this counts as a failure even if it succeeds
+_RECALL_SLOW_SECONDS = 2.0
+_recall_breaker_lock = threading.Lock()
+
+
+@dataclass(slots=True)
+class _RecallBreakerState:
+    """Consecutive recall failures and open-until time for one Hindsight endpoint."""
 
+    failures: int = 0
+    open_until: float = 0.0
 
-@dataclass
+
+# Breaker state per api_url, so one degraded endpoint doesn't disable recall
+# for wrappers pointed at another
+_recall_breakers: Dict[str, _RecallBreakerState] = {}
+
+
+def _recall_breaker_is_open(api_url: str) -> bool:
+    """Return True if recalls against api_url should be skipped because its breaker has tripped."""
+    state = _recall_breakers.get(api_url)
+    return state is not None and time.monotonic() < state.open_until
+
+
+def _record_recall_outcome(api_url: str, ok: bool, elapsed: float) -> None:
+    """Update api_url's recall breaker after a recall attempt."""
+    with _recall_breaker_lock:
+        state = _recall_breakers.get(api_url)
+        if state is None:
+            state = _recall_breakers[api_url] = _RecallBreakerState()
+        if ok and elapsed <= _RECALL_SLOW_SECONDS:
+            state.failures = 0
+            return
+        state.failures += 1
+        if state.failures >= _RECALL_BREAKER_THRESHOLD:
+            state.failures = 0
+            state.open_until = time.monotonic() + _RECALL_BREAKER_COOLDOWN_SECONDS
+            logger.warning(
+                f"Hindsight recall at {api_url} failing or slow, skipping memory "
+                f"recall for {_RECALL_BREAKER_COOLDOWN_SECONDS:.0f}s"
+            )
+
+
+def _reset_recall_breaker() -> None:
+    """Close every endpoint's recall breaker and clear its failure count."""
+    with _recall_breaker_lock:
+        _recall_breakers.clear()
+
+
+@atexit.register
+def _close_all_clients():
+    """Close clients left open by any thread when the interpreter exits."""
+    with _all_clients_lock:
+        remaining = list(_all_clients)
+        _all_clients.clear()
+    for client, loop in remaining:
+        _dispose_client(client, loop)
+
+
+@dataclass(slots=True)
 class RecallResult:
     """A single memory recall result."""
 
@@ -61,7 +264,7 @@ class RecallResult:
         return self.text
 
 
-@dataclass
+@dataclass(slots=True)
 class RecallDebugInfo:
     """Debug information from a recall operation."""
 
@@ -74,7 +277,7 @@ class RecallDebugInfo:
     api_url: str
 
 
-@dataclass
+@dataclass(slots=True)
 class RecallResponse:
     """Response from a recall operation, including results and optional debug info."""
 
@@ -94,6 +297,96 @@ class RecallResponse:
         return bool(self.results)
 
 
+def _resolve_recall(
+    query: str,
+    bank_id: Optional[str],
+    fact_types: Optional[List[str]],
+    budget: Optional[str],
+    max_tokens: Optional[int],
+    hindsight_api_url: Optional[str],
+) -> tuple:
+    """Resolve recall() arguments against the configured defaults.
+
+    Returns:
+        Tuple of (config, api_url, recall_kwargs) where recall_kwargs are the
+        keyword arguments for the Hindsight client's recall call.
+    """
+    # Get config and defaults, or use overrides
+    config = get_config()
+    defaults = get_defaults()
+
+    api_url = hindsight_api_url or (config.hindsight_api_url if config else None)
+    target_bank_id = bank_id or (defaults.bank_id if defaults else None)
+    target_fact_types = fact_types or (defaults.fact_types if defaults else None)
+    target_budget = budget or (defaults.budget if defaults else "mid")
+    target_max_tokens = max_tokens or (defaults.max_memory_tokens if defaults else 4096)
+
+    if not api_url or not target_bank_id:
+        raise RuntimeError(
+            "Hindsight not configured. Call configure() or provide bank_id and hindsight_api_url."
+        )
+
+    recall_kwargs = {
+        "bank_id": target_bank_id,
+        "query": query,
+        "types": target_fact_types,
+        "budget": target_budget,
+        "max_tokens": target_max_tokens,
+    }
+    return config, api_url, recall_kwargs
+
+
+def _to_recall_result(r: Any) -> Optional[RecallResult]:
+    """Convert one recall item (client model or API dict) into a RecallResult."""
+    if isinstance(r, dict):
+        # Dict from API response - API returns 'type' not 'fact_type'
+        return RecallResult(
+            text=r.get("text", str(r)),
+            fact_type=r.get("type") or r.get("fact_type", "unknown"),
+            weight=r.get("weight", 0.0),
+            metadata=r.get("metadata"),
+        )
+
+    # Object with attributes - the shape hindsight_client always returns
+    text = getattr(r, "text", _MISSING)
+    if text is _MISSING:
+        return None
+    return RecallResult(
+        text=text,
+        fact_type=getattr(r, "type", None) or getattr(r, "fact_type", "unknown"),
+        weight=getattr(r, "weight", 0.0),
+        metadata=getattr(r, "metadata", None),
+    )
+
+
+def _build_recall_response(
+    results: Any, config: Any, api_url: str, recall_kwargs: Dict[str, Any]
+) -> RecallResponse:
+    """Convert a Hindsight client recall result into a RecallResponse."""
+    # Convert to RecallResult objects
+    recall_results = []
+    if results:
+        for r in results:
+            recall_result = _to_recall_result(r)
+            if recall_result is not None:
+                recall_results.append(recall_result)
+
+    # Include debug info if verbose
+    debug_info = None
+    if config and config.verbose:
+        debug_info = RecallDebugInfo(
+            query=recall_kwargs["query"],
+            bank_id=recall_kwargs["bank_id"],
+            budget=recall_kwargs["budget"],
+            max_tokens=recall_kwargs["max_tokens"],
+            fact_types=recall_kwargs["types"],
+            results_count=len(recall_results),
+            api_url=api_url,
+        )
+
+    return RecallResponse(results=recall_results, debug=debug_info)
+
+
 def recall(
     query: str,
     bank_id: Optional[str] = None,
@@ -139,78 +432,14 @@ def recall(
         >>> if memories.debug:
         ...     print(f"Queried bank: {memories.debug.bank_id}")
     """
-    # Get config and defaults, or use overrides
-    config = get_config()
-    defaults = get_defaults()
-
-    api_url = hindsight_api_url or (config.hindsight_api_url if config else None)
-    target_bank_id = bank_id or (defaults.bank_id if defaults else None)
-    target_fact_types = fact_types or (defaults.fact_types if defaults else None)
-    target_budget = budget or (defaults.budget if defaults else "mid")
-    target_max_tokens = max_tokens or (defaults.max_memory_tokens if defaults else 4096)
-
-    if not api_url or not target_bank_id:
-        raise RuntimeError(
-            "Hindsight not configured. Call configure() or provide bank_id and hindsight_api_url."
-        )
+    config, api_url, recall_kwargs = _resolve_recall(
+        query, bank_id, fact_types, budget, max_tokens, hindsight_api_url
+    )
 
-    client = None
     try:
-        # Create fresh client for this operation
         client = _get_client(api_url, config.api_key if config else None)
-
-        # Call recall API
-        results = client.recall(
-            bank_id=target_bank_id,
-            query=query,
-            types=target_fact_types,
-            budget=target_budget,
-            max_tokens=target_max_tokens,
-        )
-
-        # Convert to RecallResult objects
-        recall_results = []
-        if results:
-            for r in results:
-                if hasattr(r, "text"):
-                    # Object with attributes
-                    fact_type = getattr(r, "type", None) or getattr(
-                        r, "fact_type", "unknown"
-                    )
-                    recall_results.append(
-                        RecallResult(
-                            text=r.text,
-                            fact_type=fact_type,
-                            weight=getattr(r, "weight", 0.0),
-                            metadata=getattr(r, "metadata", None),
-                        )
-                    )
-                elif isinstance(r, dict):
-                    # Dict from API response - API returns 'type' not 'fact_type'
-                    fact_type = r.get("type") or r.get("fact_type", "unknown")
-                    recall_results.append(
-                        RecallResult(
-                            text=r.get("text", str(r)),
-                            fact_type=fact_type,
-                            weight=r.get("weight", 0.0),
-                            metadata=r.get("metadata"),
-                        )
-                    )
-
-        # Include debug info if verbose
-        debug_info = None
-        if config and config.verbose:
-            debug_info = RecallDebugInfo(
-                query=query,
-                bank_id=target_bank_id,
-                budget=target_budget,
-                max_tokens=target_max_tokens,
-                fact_types=target_fact_types,
-                results_count=len(recall_results),
-                api_url=api_url,
-            )
-
-        return RecallResponse(results=recall_results, debug=debug_info)
+        results = client.recall(**recall_kwargs)
+        return _build_recall_response(results, config, api_url, recall_kwargs)
 
     except ImportError as e:
         raise RuntimeError(f"hindsight-client not installed: {e}")
@@ -218,12 +447,6 @@ def recall(
         if config and config.verbose:
             logger.warning(f"Failed to recall memories: {e}")
         raise
-    finally:
-        if client is not None:
-            try:
-                client.close()
-            except Exception:
-                pass
 
 
 async def arecall(
@@ -238,23 +461,24 @@ async def arecall(
 
     See recall() for full documentation.
     """
-    import asyncio
-
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(
-        None,
-        lambda: recall(
-            query=query,
-            bank_id=bank_id,
-            fact_types=fact_types,
-            budget=budget,
-            max_tokens=max_tokens,
-            hindsight_api_url=hindsight_api_url,
-        ),
+    config, api_url, recall_kwargs = _resolve_recall(
+        query, bank_id, fact_types, budget, max_tokens, hindsight_api_url
     )
 
+    try:
+        client = _get_client(api_url, config.api_key if config else None)
+        results = await client.arecall(**recall_kwargs)
+        return _build_recall_response(results, config, api_url, recall_kwargs)
 
-@dataclass
+    except ImportError as e:
+        raise RuntimeError(f"hindsight-client not installed: {e}")
+    except Exception as e:
+        if config and config.verbose:
+            logger.warning(f"Failed to recall memories: {e}")
+        raise
+
+
+@dataclass(slots=True)
 class ReflectDebugInfo:
     """Debug information from a reflect operation."""
 
@@ -265,7 +489,7 @@ class ReflectDebugInfo:
     api_url: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ReflectResult:
     """Result from a reflect operation."""
 
@@ -277,6 +501,65 @@ class ReflectResult:
         return self.text
 
 
+def _resolve_reflect(
+    query: str,
+    bank_id: Optional[str],
+    budget: Optional[str],
+    context: Optional[str],
+    response_schema: Optional[dict],
+    hindsight_api_url: Optional[str],
+) -> tuple:
+    """Resolve reflect() arguments against the configured defaults.
+
+    Returns:
+        Tuple of (config, api_url, reflect_kwargs) where reflect_kwargs are the
+        keyword arguments for the Hindsight client's reflect call.
+    """
+    config = get_config()
+    defaults = get_defaults()
+
+    api_url = hindsight_api_url or (config.hindsight_api_url if config else None)
+    target_bank_id = bank_id or (defaults.bank_id if defaults else None)
+    target_budget = budget or (defaults.budget if defaults else "mid")
+
+    if not api_url or not target_bank_id:
+        raise RuntimeError(
+            "Hindsight not configured. Call configure() or provide bank_id and hindsight_api_url."
+        )
+
+    reflect_kwargs = {
+        "bank_id": target_bank_id,
+        "query": query,
+        "budget": target_budget,
+    }
+    if context is not None:
+        reflect_kwargs["context"] = context
+    if response_schema is not None:
+        reflect_kwargs["response_schema"] = response_schema
+    return config, api_url, reflect_kwargs
+
+
+def _build_reflect_result(
+    result: Any, config: Any, api_url: str, reflect_kwargs: Dict[str, Any]
+) -> ReflectResult:
+    """Convert a Hindsight client reflect result into a ReflectResult."""
+    text = result.text if hasattr(result, "text") else str(result)
+    based_on = getattr(result, "based_on", None)
+
+    # Include debug info if verbose
+    debug_info = None
+    if config and config.verbose:
+        debug_info = ReflectDebugInfo(
+            query=reflect_kwargs["query"],
+            bank_id=reflect_kwargs["bank_id"],
+            budget=reflect_kwargs["budget"],
+            context=reflect_kwargs.get("context"),
+            api_url=api_url,
+        )
+
+    return ReflectResult(text=text, based_on=based_on, debug=debug_info)
+
+
 def reflect(
     query: str,
     bank_id: Optional[str] = None,
@@ -314,51 +597,14 @@ def reflect(
         >>> print(result.text)
         Based on our conversations, you're working on a FastAPI project...
     """
-    config = get_config()
-    defaults = get_defaults()
-
-    api_url = hindsight_api_url or (config.hindsight_api_url if config else None)
-    target_bank_id = bank_id or (defaults.bank_id if defaults else None)
-    target_budget = budget or (defaults.budget if defaults else "mid")
-
-    if not api_url or not target_bank_id:
-        raise RuntimeError(
-            "Hindsight not configured. Call configure() or provide bank_id and hindsight_api_url."
-        )
+    config, api_url, reflect_kwargs = _resolve_reflect(
+        query, bank_id, budget, context, response_schema, hindsight_api_url
+    )
 
-    client = None
     try:
-        # Create fresh client for this operation
         client = _get_client(api_url, config.api_key if config else None)
-
-        # Call reflect API
-        reflect_kwargs = {
-            "bank_id": target_bank_id,
-            "query": query,
-            "budget": target_budget,
-        }
-        if context is not None:
-            reflect_kwargs["context"] = context
-        if response_schema is not None:
-            reflect_kwargs["response_schema"] = response_schema
         result = client.reflect(**reflect_kwargs)
-
-        # Convert to ReflectResult
-        text = result.text if hasattr(result, "text") else str(result)
-        based_on = getattr(result, "based_on", None)
-
-        # Include debug info if verbose
-        debug_info = None
-        if config and config.verbose:
-            debug_info = ReflectDebugInfo(
-                query=query,
-                bank_id=target_bank_id,
-                budget=target_budget,
-                context=context,
-                api_url=api_url,
-            )
-
-        return ReflectResult(text=text, based_on=based_on, debug=debug_info)
+        return _build_reflect_result(result, config, api_url, reflect_kwargs)
 
     except ImportError as e:
         raise RuntimeError(f"hindsight-client not installed: {e}")
@@ -366,12 +612,6 @@ def reflect(
         if config and config.verbose:
             logger.warning(f"Failed to reflect: {e}")
         raise
-    finally:
-        if client is not None:
-            try:
-                client.close()
-            except Exception:
-                pass
 
 
 async def areflect(
@@ -386,23 +626,24 @@ async def areflect(
 
     See reflect() for full documentation.
     """
-    import asyncio
-
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(
-        None,
-        lambda: reflect(
-            query=query,
-            bank_id=bank_id,
-            budget=budget,
-            context=context,
-            response_schema=response_schema,
-            hindsight_api_url=hindsight_api_url,
-        ),
+    config, api_url, reflect_kwargs = _resolve_reflect(
+        query, bank_id, budget, context, response_schema, hindsight_api_url
     )
 
+    try:
+        client = _get_client(api_url, config.api_key if config else None)
+        result = await client.areflect(**reflect_kwargs)
+        return _build_reflect_result(result, config, api_url, reflect_kwargs)
+
+    except ImportError as e:
+        raise RuntimeError(f"hindsight-client not installed: {e}")
+    except Exception as e:
+        if config and config.verbose:
+            logger.warning(f"Failed to reflect: {e}")
+        raise
+
 
-@dataclass
+@dataclass(slots=True)
 class RetainDebugInfo:
     """Debug information from a retain operation."""
 
@@ -415,7 +656,7 @@ class RetainDebugInfo:
     api_url: str
 
 
-@dataclass
+@dataclass(slots=True)
 class RetainResult:
     """Result from a retain operation."""
 
@@ -439,9 +680,7 @@ def _retain_sync(
     api_key: Optional[str] = None,
 ) -> RetainResult:
     """Internal synchronous retain implementation."""
-    client = None
     try:
-        # Create fresh client for this operation
         client = _get_client(api_url, api_key)
 
         # Build retain kwargs
@@ -484,12 +723,6 @@ def _retain_sync(
         if verbose:
             logger.warning(f"Failed to retain: {e}")
         raise
-    finally:
-        if client is not None:
-            try:
-                client.close()
-            except Exception:
-                pass
 
 
 def _retain_background(
@@ -504,7 +737,6 @@ def _retain_background(
     api_key: Optional[str] = None,
 ) -> None:
     """Background thread worker for async retain."""
-    global _retain_errors
     try:
         _retain_sync(
             content=content,
@@ -518,9 +750,10 @@ def _retain_background(
             api_key=api_key,
         )
     except Exception as e:
-        with _retain_errors_lock:
-            _retain_errors.append(e)
+        _retain_errors.append(e)
         logger.warning(f"Background retain failed: {e}")
+    finally:
+        _retain_slots.release()
 
 
 def get_pending_retain_errors() -> List[Exception]:
@@ -530,8 +763,9 @@ def get_pending_retain_errors() -> List[Exception]:
     Call this periodically to check for and handle any failures.
 
     Returns:
-        List of exceptions from failed background retain operations.
-        The list is cleared after calling this function.
+        List of exceptions from failed background retain operations
+        (at most the 1024 most recent). They are cleared after calling this
+        function.
 
     Example:
         >>> errors = get_pending_retain_errors()
@@ -539,13 +773,39 @@ def get_pending_retain_errors() -> List[Exception]:
         ...     for e in errors:
         ...         print(f"Retain failed: {e}")
     """
-    global _retain_errors
-    with _retain_errors_lock:
-        errors = _retain_errors.copy()
-        _retain_errors.clear()
+    errors = []
+    try:
+        while True:
+            errors.append(_retain_errors.popleft())
+    except IndexError:
+        pass
     return errors
 
 
+def _forget_pending_retain(future: Future) -> None:
+    with _pending_retains_lock:
+        _pending_retains.discard(future)
+
+
+def _submit_retain(fn: Any, *args: Any) -> RetainResult:
+    """Queue a background retain, or record an error if the queue is full."""
+    if not _retain_slots.acquire(blocking=False):
+        error = RuntimeError("Background retain queue is full; dropping retain")
+        _retain_errors.append(error)
+        logger.warning(str(error))
+        return RetainResult(success=False, items_count=0)
+    try:
+        future = _get_retain_executor().submit(fn, *args)
+    except Exception:
+        _retain_slots.release()
+        raise
+    with _pending_retains_lock:
+        _pending_retains.add(future)
+    future.add_done_callback(_forget_pending_retain)
+    # Return immediate success - actual errors collected via get_pending_retain_errors()
+    return RetainResult(success=True, items_count=0)
+
+
 def retain(
     content: str,
     bank_id: Optional[str] = None,
@@ -577,8 +837,9 @@ def retain(
 
     Returns:
         RetainResult indicating success. For async mode (sync=False),
-        always returns success=True immediately; actual errors are
-        collected via get_pending_retain_errors().
+        returns success=True immediately (or success=False if the background
+        queue is full); actual errors are collected via
+        get_pending_retain_errors().
 
     Raises:
         RuntimeError: If Hindsight is not configured and no overrides provided
@@ -627,26 +888,134 @@ def retain(
             api_key=api_key,
         )
     else:
-        # Async mode - run in background thread
-        thread = threading.Thread(
-            target=_retain_background,
-            args=(
-                content,
-                api_url,
-                target_bank_id,
-                context,
-                target_document_id,
-                target_tags,
-                metadata,
-                verbose,
-                api_key,
-            ),
-            daemon=True,
+        # Async mode - hand off to the shared retain worker pool
+        return _submit_retain(
+            _retain_background,
+            content,
+            api_url,
+            target_bank_id,
+            context,
+            target_document_id,
+            target_tags,
+            metadata,
+            verbose,
+            api_key,
+        )
+
+
+def _retain_batch_sync(
+    items: List[Dict[str, Any]],
+    api_url: str,
+    target_bank_id: str,
+    verbose: bool,
+    api_key: Optional[str] = None,
+) -> RetainResult:
+    """Internal synchronous batch retain implementation."""
+    try:
+        client = _get_client(api_url, api_key)
+        result = client.retain_batch(bank_id=target_bank_id, items=items)
+
+        success = getattr(result, "success", True)
+        items_count = getattr(result, "items_count", len(items))
+        if verbose:
+            logger.info(f"Stored {len(items)} items to Hindsight bank: {target_bank_id}")
+        return RetainResult(success=success, items_count=items_count)
+
+    except ImportError as e:
+        raise RuntimeError(f"hindsight-client not installed: {e}")
+    except Exception as e:
+        if verbose:
+            logger.warning(f"Failed to retain batch: {e}")
+        raise
+
+
+def _retain_batch_background(
+    items: List[Dict[str, Any]],
+    api_url: str,
+    target_bank_id: str,
+    verbose: bool,
+    api_key: Optional[str] = None,
+) -> None:
+    """Background thread worker for async batch retain."""
+    try:
+        _retain_batch_sync(items, api_url, target_bank_id, verbose, api_key)
+    except Exception as e:
+        _retain_errors.append(e)
+        logger.warning(f"Background retain failed: {e}")
+    finally:
+        _retain_slots.release()
+
+
+def retain_batch(
+    items: List[Dict[str, Any]],
+    bank_id: Optional[str] = None,
+    hindsight_api_url: Optional[str] = None,
+    sync: bool = False,
+) -> RetainResult:
+    """Store several pieces of content to Hindsight memory in one request.
+
+    Equivalent to calling retain() once per item, but sends a single HTTP
+    request instead of one per item.
+
+    Args:
+        items: Items to store. Each is a dict with "content" and optional
+            "context", "document_id", "tags", "metadata" and "timestamp" keys.
+            Configured default document_id and tags apply to items without them.
+        bank_id: Override the configured bank_id
+        hindsight_api_url: Override the configured API URL
+        sync: If True, block until storage completes. If False (default),
+            run in background thread. Use get_pending_retain_errors() to
+            check for async failures.
+
+    Returns:
+        RetainResult indicating success. For async mode (sync=False),
+        returns success=True immediately (or success=False if the background
+        queue is full).
+
+    Raises:
+        RuntimeError: If Hindsight is not configured and no overrides provided
+        Exception: Only raised in sync mode if storage fails
+
+    Example:
+        >>> retain_batch([
+        ...     {"content": "User prefers dark mode", "context": "user_preference"},
+        ...     {"content": "User lives in Berlin"},
+        ... ])
+    """
+    config = get_config()
+    defaults = get_defaults()
+
+    api_url = hindsight_api_url or (config.hindsight_api_url if config else None)
+    target_bank_id = bank_id or (defaults.bank_id if defaults else None)
+    default_document_id = defaults.document_id if defaults else None
+    default_tags = defaults.tags if defaults else None
+    verbose = config.verbose if config else False
+
+    if not api_url or not target_bank_id:
+        raise RuntimeError(
+            "Hindsight not configured. Call configure() or provide bank_id and hindsight_api_url."
         )
-        thread.start()
-        # Return immediate success - actual errors collected via get_pending_retain_errors()
+    if not items:
         return RetainResult(success=True, items_count=0)
 
+    batch_items = []
+    for item in items:
+        batch_item = dict(item)
+        if not batch_item.get("document_id") and default_document_id:
+            batch_item["document_id"] = default_document_id
+        if not batch_item.get("tags") and default_tags:
+            batch_item["tags"] = default_tags
+        batch_items.append(batch_item)
+
+    api_key = config.api_key if config else None
+
+    if sync:
+        return _retain_batch_sync(batch_items, api_url, target_bank_id, verbose, api_key)
+
+    return _submit_retain(
+        _retain_batch_background, batch_items, api_url, target_bank_id, verbose, api_key
+    )
+
 
 async def aretain(
     content: str,
@@ -659,25 +1028,226 @@ async def aretain(
 ) -> RetainResult:
     """Async version of retain().
 
+    Storage runs on the background retain worker pool (see retain() with
+    sync=False), so this returns without waiting for the request.
+
     See retain() for full documentation.
     """
-    import asyncio
+    return retain(
+        content=content,
+        bank_id=bank_id,
+        context=context,
+        document_id=document_id,
+        tags=tags,
+        metadata=metadata,
+        hindsight_api_url=hindsight_api_url,
+    )
 
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(
-        None,
-        lambda: retain(
-            content=content,
-            bank_id=bank_id,
-            context=context,
-            document_id=document_id,
-            tags=tags,
-            metadata=metadata,
-            hindsight_api_url=hindsight_api_url,
-        ),
+
+# Uppercase labels for the known fact types, so formatting doesn't allocate one per memory
+_FACT_TYPE_LABELS = {
+    "world": "WORLD",
+    "experience": "EXPERIENCE",
+    "opinion": "OPINION",
+    "observation": "OBSERVATION",
+    "memory": "MEMORY",
+}
+
+
+def fact_type_label(fact_type: Optional[str]) -> str:
+    """Return the uppercase label shown for a fact type in injected memory context."""
+    if not fact_type:
+        return "MEMORY"
+    return _FACT_TYPE_LABELS.get(fact_type, fact_type.upper())
+
+
+def _format_memory_line(index: int, r: Any) -> str:
+    """Format a single recalled memory as a numbered line for prompt injection."""
+    text = r.text if hasattr(r, "text") else str(r)
+    fact_type = getattr(r, "type", None) or getattr(r, "fact_type", "memory")
+
+    # Build memory line with available context
+    line = f"{index}. [{fact_type_label(fact_type)}]"
+
+    # Add temporal context if available
+    occurred_start = getattr(r, "occurred_start", None)
+    if occurred_start:
+        occurred_end = getattr(r, "occurred_end", None)
+        if occurred_end and occurred_start != occurred_end:
+            line += f" (occurred: {occurred_start} to {occurred_end})"
+        else:
+            line += f" (occurred: {occurred_start})"
+    else:
+        mentioned_at = getattr(r, "mentioned_at", None)
+        if mentioned_at:
+            line += f" (mentioned: {mentioned_at})"
+
+    # Add source context if available
+    context = getattr(r, "context", None)
+    if context:
+        line += f" [source: {context}]"
+
+    # Add the main text
+    line += f" {text}"
+
+    # Add metadata if available
+    metadata = getattr(r, "metadata", None)
+    if metadata:
+        meta_str = ", ".join(f"{k}={v}" for k, v in metadata.items())
+        line += f" ({meta_str})"
+
+    return line
+
+
+def _format_memory_context(results: Any) -> str:
+    """Format recalled memories into the context block injected into prompts."""
+    if not results:
+        return ""
+
+    current_time = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
+    return (
+        f"# Relevant Memories\n"
+        f"Current date/time: {current_time}\n"
+        f"The following information from memory may be relevant:\n\n"
+        + "\n".join(_format_memory_line(i, r) for i, r in enumerate(results, 1))
     )
 
 
+def _recall_for_injection(
+    api_url: str,
+    get_client: Callable[[], Any],
+    query: str,
+    settings: HindsightCallSettings,
+) -> str:
+    """Recall memories for a wrapped client's create() call and format them for injection.
+
+    Recall goes through api_url's circuit breaker; any failure yields "" so the
+    LLM call proceeds without memories.
+    """
+    if not settings.inject_memories:
+        return ""
+
+    if not settings.bank_id:
+        if settings.verbose:
+            logger.warning("No bank_id configured, skipping memory recall")
+        return ""
+
+    if _recall_breaker_is_open(api_url):
+        return ""
+
+    try:
+        client = get_client()
+
+        recall_kwargs = {
+            "bank_id": settings.bank_id,
+            "query": query,
+            "budget": settings.budget,
+            "max_tokens": settings.max_memory_tokens,
+            "trace": settings.trace,
+            "include_entities": settings.include_entities,
+        }
+        if settings.fact_types:
+            recall_kwargs["types"] = settings.fact_types
+        if settings.recall_tags:
+            recall_kwargs["tags"] = settings.recall_tags
+            recall_kwargs["tags_match"] = settings.recall_tags_match
+
+        started = time.monotonic()
+        try:
+            results = client.recall(**recall_kwargs)
+        except Exception:
+            _record_recall_outcome(api_url, False, time.monotonic() - started)
+            raise
+        _record_recall_outcome(api_url, True, time.monotonic() - started)
+
+        if not results:
+            return ""
+
+        results_to_use = (
+            results[: settings.max_memories] if settings.max_memories else results
+        )
+        return _format_memory_context(results_to_use)
+
+    except Exception as e:
+        if settings.verbose:
+            logger.warning(f"Failed to recall memories: {e}")
+        return ""
+
+
+# Single worker so stores for the same session run in order: each store reads
+# the session document and appends to it, so they must not interleave.
+_conversation_executor: Optional[ThreadPoolExecutor] = None
+_conversation_executor_lock = threading.Lock()
+
+
+def _get_conversation_executor() -> ThreadPoolExecutor:
+    """Get or create the worker that stores wrapped-client conversations."""
+    global _conversation_executor
+    if _conversation_executor is None:
+        with _conversation_executor_lock:
+            if _conversation_executor is None:
+                _conversation_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="hindsight-store"
+                )
+    return _conversation_executor
+
+
+def _submit_conversation_store(
+    wrapper: Any,
+    user_input: str,
+    assistant_output: str,
+    model: str,
+    settings: HindsightCallSettings,
+) -> None:
+    """Store a conversation in the background so the LLM response returns immediately."""
+    _get_conversation_executor().submit(
+        wrapper._store_conversation, user_input, assistant_output, model, settings
+    )
+
+
+def _wait_for_conversation_stores() -> None:
+    """Block until all previously submitted conversation stores have finished."""
+    _get_conversation_executor().submit(lambda: None).result()
+
+
+def _drain_background_work(timeout: float) -> None:
+    """Give queued retains and conversation stores up to ``timeout`` seconds, then drop the rest.
+
+    Executor workers are not daemon threads, so without this the interpreter
+    would wait at exit for every queued call to reach an unreachable server.
+    Calls already running are still allowed to finish; queued ones are cancelled.
+    """
+    global _retain_executor, _conversation_executor
+    deadline = time.monotonic() + timeout
+    # Detach the pools first so later submits get a fresh one instead of a shut-down one
+    with _retain_executor_lock:
+        retain_executor, _retain_executor = _retain_executor, None
+    with _conversation_executor_lock:
+        conversation_executor, _conversation_executor = _conversation_executor, None
+    if retain_executor is not None:
+        with _pending_retains_lock:
+            pending = list(_pending_retains)
+        wait_futures(pending, timeout=max(0.0, deadline - time.monotonic()))
+        retain_executor.shutdown(wait=False, cancel_futures=True)
+    if conversation_executor is not None:
+        wait_futures(
+            [conversation_executor.submit(lambda: None)],
+            timeout=max(0.0, deadline - time.monotonic()),
+        )
+        conversation_executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _drain_background_work_at_exit() -> None:
+    _drain_background_work(float(os.environ.get(HINDSIGHT_SHUTDOWN_TIMEOUT_ENV, 5)))
+
+
+# The drain has to run before interpreter shutdown joins the (non-daemon)
+# executor workers, which happens before atexit hooks run. CPython's
+# threading._register_atexit hooks run ahead of that join. Where that private
+# hook is missing, fall back to atexit; the drain then runs after the join.
+getattr(threading, "_register_atexit", atexit.register)(_drain_background_work_at_exit)
+
+
 class _StreamWrapper:
     """Wrapper for OpenAI stream that collects content and stores conversation when done."""
 
@@ -732,8 +1302,12 @@ class _StreamWrapper:
             assistant_output = "".join(self._collected_content)
             if assistant_output:
                 try:
-                    self._wrapper._store_conversation(
-                        self._user_query, assistant_output, self._model, self._settings
+                    _submit_conversation_store(
+                        self._wrapper,
+                        self._user_query,
+                        assistant_output,
+                        self._model,
+                        self._settings,
                     )
                 except Exception as e:
                     if self._settings.verbose:
@@ -803,8 +1377,12 @@ class _AnthropicStreamWrapper:
             assistant_output = "".join(self._collected_content)
             if assistant_output:
                 try:
-                    self._wrapper._store_conversation(
-                        self._user_query, assistant_output, self._model, self._settings
+                    _submit_conversation_store(
+                        self._wrapper,
+                        self._user_query,
+                        assistant_output,
+                        self._model,
+                        self._settings,
                     )
                 except Exception as e:
                     if self._settings.verbose:
@@ -872,7 +1450,6 @@ class HindsightOpenAI:
         self._client = client
         self._api_url = hindsight_api_url
         self._api_key = api_key
-        self._hindsight_client = None
 
         # Build default settings from kwargs or use provided settings
         if default_settings is not None:
@@ -889,105 +1466,14 @@ class HindsightOpenAI:
         self.chat = _WrappedChat(self)
 
     def _get_hindsight_client(self):
-        """Get or create the Hindsight client."""
-        if self._hindsight_client is None:
-            from hindsight_client import Hindsight
-
-            self._hindsight_client = Hindsight(
-                base_url=self._api_url,
-                api_key=self._api_key,
-                timeout=30.0,
-            )
-        return self._hindsight_client
+        """Get the shared Hindsight client for the calling thread."""
+        return _get_client(self._api_url, self._api_key)
 
     def _recall_memories(self, query: str, settings: HindsightCallSettings) -> str:
         """Recall and format memories for injection."""
-        if not settings.inject_memories:
-            return ""
-
-        if not settings.bank_id:
-            if settings.verbose:
-                logger.warning("No bank_id configured, skipping memory recall")
-            return ""
-
-        try:
-            client = self._get_hindsight_client()
-
-            recall_kwargs = {
-                "bank_id": settings.bank_id,
-                "query": query,
-                "budget": settings.budget,
-                "max_tokens": settings.max_memory_tokens,
-                "trace": settings.trace,
-                "include_entities": settings.include_entities,
-            }
-            if settings.fact_types:
-                recall_kwargs["types"] = settings.fact_types
-            if settings.recall_tags:
-                recall_kwargs["tags"] = settings.recall_tags
-                recall_kwargs["tags_match"] = settings.recall_tags_match
-
-            results = client.recall(**recall_kwargs)
-
-            if not results:
-                return ""
-
-            results_to_use = (
-                results[: settings.max_memories] if settings.max_memories else results
-            )
-            memory_lines = []
-            for i, r in enumerate(results_to_use, 1):
-                text = r.text if hasattr(r, "text") else str(r)
-                fact_type = getattr(r, "type", None) or getattr(
-                    r, "fact_type", "memory"
-                )
-
-                # Build memory line with available context
-                line_parts = [f"{i}. [{fact_type.upper()}]"]
-
-                # Add temporal context if available
-                occurred_start = getattr(r, "occurred_start", None)
-                occurred_end = getattr(r, "occurred_end", None)
-                mentioned_at = getattr(r, "mentioned_at", None)
-
-                if occurred_start and occurred_end and occurred_start != occurred_end:
-                    line_parts.append(f"(occurred: {occurred_start} to {occurred_end})")
-                elif occurred_start:
-                    line_parts.append(f"(occurred: {occurred_start})")
-                elif mentioned_at:
-                    line_parts.append(f"(mentioned: {mentioned_at})")
-
-                # Add source context if available
-                context = getattr(r, "context", None)
-                if context:
-                    line_parts.append(f"[source: {context}]")
-
-                # Add the main text
-                line_parts.append(text)
-
-                # Add metadata if available
-                metadata = getattr(r, "metadata", None)
-                if metadata:
-                    meta_str = ", ".join(f"{k}={v}" for k, v in metadata.items())
-                    line_parts.append(f"({meta_str})")
-
-                memory_lines.append(" ".join(line_parts))
-
-            if not memory_lines:
-                return ""
-
-            current_time = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
-            return (
-                f"# Relevant Memories\n"
-                f"Current date/time: {current_time}\n"
-                f"The following information from memory may be relevant:\n\n"
-                + "\n".join(memory_lines)
-            )
-
-        except Exception as e:
-            if settings.verbose:
-                logger.warning(f"Failed to recall memories: {e}")
-            return ""
+        return _recall_for_injection(
+            self._api_url, self._get_hindsight_client, query, settings
+        )
 
     def _reflect_memories(self, query: str, settings: HindsightCallSettings) -> str:
         """Use reflect API for disposition-aware memory retrieval."""
@@ -1040,8 +1526,6 @@ class HindsightOpenAI:
         Returns:
             The document's original_text, or None if not found.
         """
-        import asyncio
-
         from hindsight_client_api.api import documents_api
 
         try:
@@ -1145,6 +1629,28 @@ class _WrappedChat:
         self.completions = _WrappedCompletions(wrapper)
 
 
+def _extract_last_user_text(messages: List[Dict[str, Any]]) -> Optional[str]:
+    """Return the text of the most recent user message, if any.
+
+    For structured content (e.g., vision messages) the first text part is
+    used; user messages without non-empty text are skipped.
+    """
+    for msg in reversed(messages):
+        if msg.get("role") != "user":
+            continue
+        content = msg.get("content")
+        if isinstance(content, str):
+            return content
+        if isinstance(content, list):
+            for item in content:
+                if isinstance(item, dict) and item.get("type") == "text":
+                    text = item.get("text", "")
+                    if text:
+                        return text
+                    break
+    return None
+
+
 class _WrappedCompletions:
     """Wrapped completions interface for OpenAI client."""
 
@@ -1171,29 +1677,18 @@ class _WrappedCompletions:
             k: v for k, v in kwargs.items() if not k.startswith("hindsight_")
         }
 
-        messages = list(openai_kwargs.get("messages", []))
+        messages = openai_kwargs.get("messages", [])
         model = openai_kwargs.get("model", "gpt-4")
 
         # Extract user query (use custom query if provided, else extract from messages)
-        user_query = settings.query
-        if not user_query:
-            for msg in reversed(messages):
-                if msg.get("role") == "user":
-                    content = msg.get("content")
-                    if isinstance(content, str):
-                        user_query = content
-                        break
-                    elif isinstance(content, list):
-                        # Handle structured content (e.g., vision messages)
-                        for item in content:
-                            if isinstance(item, dict) and item.get("type") == "text":
-                                user_query = item.get("text", "")
-                                break
-                        if user_query:
-                            break
+        user_query = settings.query or _extract_last_user_text(messages)
 
         # Inject memories
-        if user_query and settings.inject_memories:
+        if (
+            user_query
+            and settings.inject_memories
+            and len(user_query.strip()) >= settings.min_query_length
+        ):
             # Use reflect or recall based on settings
             if settings.use_reflect:
                 memory_context = self._wrapper._reflect_memories(user_query, settings)
@@ -1204,6 +1699,9 @@ class _WrappedCompletions:
                 if settings.verbose:
                     logger.debug(f"Injecting memories into prompt:\n{memory_context}")
 
+                # Copy before modifying so the caller's list is left untouched
+                messages = list(messages)
+
                 # Find system message and append, or prepend new one
                 found_system = False
                 for i, msg in enumerate(messages):
@@ -1243,9 +1741,13 @@ class _WrappedCompletions:
                 if response.choices and response.choices[0].message:
                     assistant_output = response.choices[0].message.content or ""
                     if assistant_output:
-                        self._wrapper._store_conversation(
-                            user_query, assistant_output, model, settings
-                        )
+                        try:
+                            _submit_conversation_store(
+                                self._wrapper, user_query, assistant_output, model, settings
+                            )
+                        except Exception as e:
+                            if settings.verbose:
+                                logger.warning(f"Failed to store conversation: {e}")
             return response
 
 
@@ -1301,7 +1803,6 @@ class HindsightAnthropic:
         self._client = client
         self._api_url = hindsight_api_url
         self._api_key = api_key
-        self._hindsight_client = None
 
         # Build default settings from kwargs or use provided settings
         if default_settings is not None:
@@ -1318,105 +1819,14 @@ class HindsightAnthropic:
         self.messages = _WrappedAnthropicMessages(self)
 
     def _get_hindsight_client(self):
-        """Get or create the Hindsight client."""
-        if self._hindsight_client is None:
-            from hindsight_client import Hindsight
-
-            self._hindsight_client = Hindsight(
-                base_url=self._api_url,
-                api_key=self._api_key,
-                timeout=30.0,
-            )
-        return self._hindsight_client
+        """Get the shared Hindsight client for the calling thread."""
+        return _get_client(self._api_url, self._api_key)
 
     def _recall_memories(self, query: str, settings: HindsightCallSettings) -> str:
         """Recall and format memories for injection."""
-        if not settings.inject_memories:
-            return ""
-
-        if not settings.bank_id:
-            if settings.verbose:
-                logger.warning("No bank_id configured, skipping memory recall")
-            return ""
-
-        try:
-            client = self._get_hindsight_client()
-
-            recall_kwargs = {
-                "bank_id": settings.bank_id,
-                "query": query,
-                "budget": settings.budget,
-                "max_tokens": settings.max_memory_tokens,
-                "trace": settings.trace,
-                "include_entities": settings.include_entities,
-            }
-            if settings.fact_types:
-                recall_kwargs["types"] = settings.fact_types
-            if settings.recall_tags:
-                recall_kwargs["tags"] = settings.recall_tags
-                recall_kwargs["tags_match"] = settings.recall_tags_match
-
-            results = client.recall(**recall_kwargs)
-
-            if not results:
-                return ""
-
-            results_to_use = (
-                results[: settings.max_memories] if settings.max_memories else results
-            )
-            memory_lines = []
-            for i, r in enumerate(results_to_use, 1):
-                text = r.text if hasattr(r, "text") else str(r)
-                fact_type = getattr(r, "type", None) or getattr(
-                    r, "fact_type", "memory"
-                )
-
-                # Build memory line with available context
-                line_parts = [f"{i}. [{fact_type.upper()}]"]
-
-                # Add temporal context if available
-                occurred_start = getattr(r, "occurred_start", None)
-                occurred_end = getattr(r, "occurred_end", None)
-                mentioned_at = getattr(r, "mentioned_at", None)
-
-                if occurred_start and occurred_end and occurred_start != occurred_end:
-                    line_parts.append(f"(occurred: {occurred_start} to {occurred_end})")
-                elif occurred_start:
-                    line_parts.append(f"(occurred: {occurred_start})")
-                elif mentioned_at:
-                    line_parts.append(f"(mentioned: {mentioned_at})")
-
-                # Add source context if available
-                context = getattr(r, "context", None)
-                if context:
-                    line_parts.append(f"[source: {context}]")
-
-                # Add the main text
-                line_parts.append(text)
-
-                # Add metadata if available
-                metadata = getattr(r, "metadata", None)
-                if metadata:
-                    meta_str = ", ".join(f"{k}={v}" for k, v in metadata.items())
-                    line_parts.append(f"({meta_str})")
-
-                memory_lines.append(" ".join(line_parts))
-
-            if not memory_lines:
-                return ""
-
-            current_time = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
-            return (
-                f"# Relevant Memories\n"
-                f"Current date/time: {current_time}\n"
-                f"The following information from memory may be relevant:\n\n"
-                + "\n".join(memory_lines)
-            )
-
-        except Exception as e:
-            if settings.verbose:
-                logger.warning(f"Failed to recall memories: {e}")
-            return ""
+        return _recall_for_injection(
+            self._api_url, self._get_hindsight_client, query, settings
+        )
 
     def _reflect_memories(self, query: str, settings: HindsightCallSettings) -> str:
         """Use reflect API for disposition-aware memory retrieval."""
@@ -1469,8 +1879,6 @@ class HindsightAnthropic:
         Returns:
             The document's original_text, or None if not found.
         """
-        import asyncio
-
         from hindsight_client_api.api import documents_api
 
         try:
@@ -1592,30 +2000,19 @@ class _WrappedAnthropicMessages:
             k: v for k, v in kwargs.items() if not k.startswith("hindsight_")
         }
 
-        messages = list(anthropic_kwargs.get("messages", []))
+        messages = anthropic_kwargs.get("messages", [])
         model = anthropic_kwargs.get("model", "claude-sonnet-4-20250514")
         system = anthropic_kwargs.get("system", "")
 
         # Extract user query (use custom query if provided, else extract from messages)
-        user_query = settings.query
-        if not user_query:
-            for msg in reversed(messages):
-                if msg.get("role") == "user":
-                    content = msg.get("content")
-                    if isinstance(content, str):
-                        user_query = content
-                        break
-                    elif isinstance(content, list):
-                        # Handle structured content
-                        for item in content:
-                            if isinstance(item, dict) and item.get("type") == "text":
-                                user_query = item.get("text", "")
-                                break
-                        if user_query:
-                            break
+        user_query = settings.query or _extract_last_user_text(messages)
 
         # Inject memories into system prompt
-        if user_query and settings.inject_memories:
+        if (
+            user_query
+            and settings.inject_memories
+            and len(user_query.strip()) >= settings.min_query_length
+        ):
             # Use reflect or recall based on settings
             if settings.use_reflect:
                 memory_context = self._wrapper._reflect_memories(user_query, settings)
@@ -1626,10 +2023,9 @@ class _WrappedAnthropicMessages:
                 if settings.verbose:
                     logger.debug(f"Injecting memories into prompt:\n{memory_context}")
 
-                if system:
-                    anthropic_kwargs["system"] = f"{system}\n\n{memory_context}"
-                else:
-                    anthropic_kwargs["system"] = memory_context
+                anthropic_kwargs["system"] = (
+                    f"{system}\n\n{memory_context}" if system else memory_context
+                )
 
         # Make the actual API call
         response = self._wrapper._client.messages.create(**anthropic_kwargs)
@@ -1652,14 +2048,19 @@ class _WrappedAnthropicMessages:
             # Non-streaming: store conversation immediately
             if user_query and settings.store_conversations:
                 if response.content:
-                    assistant_output = ""
-                    for block in response.content:
-                        if hasattr(block, "text"):
-                            assistant_output += block.text
+                    assistant_output = "".join(
+                        text
+                        for block in response.content
+                        if (text := getattr(block, "text", None))
+                    )
                     if assistant_output:
-                        self._wrapper._store_conversation(
-                            user_query, assistant_output, model, settings
-                        )
+                        try:
+                            _submit_conversation_store(
+                                self._wrapper, user_query, assistant_output, model, settings
+                            )
+                        except Exception as e:
+                            if settings.verbose:
+                                logger.warning(f"Failed to store conversation: {e}")
             return response
 
 
@@ -1697,6 +2098,7 @@ def wrap_openai(
             - fact_types: Filter by fact types (world/experience/observation)
             - max_memories: Max memories to inject (None = no limit)
             - max_memory_tokens: Max tokens for memory context (default: 4096)
+            - min_query_length: Skip memory injection for shorter queries (default: 0)
             - use_reflect: Use reflect API instead of recall (default: False)
             - reflect_context: Context for reflect reasoning
             - reflect_response_schema: JSON Schema for structured reflect output
@@ -1797,6 +2199,7 @@ def wrap_anthropic(
             - fact_types: Filter by fact types (world/experience/observation)
             - max_memories: Max memories to inject (None = no limit)
             - max_memory_tokens: Max tokens for memory context (default: 4096)
+            - min_query_length: Skip memory injection for shorter queries (default: 0)
             - use_reflect: Use reflect API instead of recall (default: False)
             - reflect_context: Context for reflect reasoning
             - reflect_response_schema: JSON Schema for structured reflect output
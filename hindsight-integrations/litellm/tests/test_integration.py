@@ -660,7 +660,7 @@ class TestStreamingSupport:
     def test_wrap_openai_stream_stores_conversation(self):
         """Test that streaming stores conversation after all chunks are consumed."""
         from unittest.mock import Mock, MagicMock, patch
-        from hindsight_litellm.wrappers import wrap_openai
+        from hindsight_litellm.wrappers import wrap_openai, _wait_for_conversation_stores
 
         # Create mock OpenAI client
         mock_client = Mock()
@@ -705,6 +705,9 @@ class TestStreamingSupport:
             # Verify all chunks were yielded
             assert len(collected) == 4
 
+            # Storage runs in the background - wait for it to finish
+            _wait_for_conversation_stores()
+
             # Verify retain was called with the complete conversation
             mock_hindsight_client.retain.assert_called_once()
             call_kwargs = mock_hindsight_client.retain.call_args[1]
@@ -714,7 +717,7 @@ class TestStreamingSupport:
     def test_wrap_anthropic_stream_stores_conversation(self):
         """Test that streaming stores conversation after all chunks are consumed."""
         from unittest.mock import Mock, MagicMock, patch
-        from hindsight_litellm.wrappers import wrap_anthropic
+        from hindsight_litellm.wrappers import wrap_anthropic, _wait_for_conversation_stores
 
         # Create mock Anthropic client
         mock_client = Mock()
@@ -761,8 +764,449 @@ class TestStreamingSupport:
             # Verify all chunks were yielded
             assert len(collected) == 4
 
+            # Storage runs in the background - wait for it to finish
+            _wait_for_conversation_stores()
+
             # Verify retain was called with the complete conversation
             mock_hindsight_client.retain.assert_called_once()
             call_kwargs = mock_hindsight_client.retain.call_args[1]
             assert "USER: Hello" in call_kwargs["content"]
             assert "ASSISTANT: Hello world!" in call_kwargs["content"]
+
+
+    def test_failed_conversation_store_keeps_response(self):
+        """Test that a failure to queue the conversation store doesn't lose the LLM response."""
+        from types import SimpleNamespace
+        from unittest.mock import Mock, patch
+        from hindsight_litellm.wrappers import wrap_anthropic, wrap_openai
+
+        openai_response = SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="Hi there"))])
+        openai_client = Mock()
+        openai_client.chat.completions.create.return_value = openai_response
+        anthropic_response = SimpleNamespace(content=[SimpleNamespace(text="Hi there")])
+        anthropic_client = Mock()
+        anthropic_client.messages.create.return_value = anthropic_response
+
+        settings = dict(
+            hindsight_api_url="http://localhost:8888",
+            bank_id="test-agent",
+            inject_memories=False,
+            store_conversations=True,
+        )
+        with patch(
+            "hindsight_litellm.wrappers._submit_conversation_store",
+            side_effect=RuntimeError("cannot schedule new futures after shutdown"),
+        ) as submit:
+            openai_result = wrap_openai(openai_client, **settings).chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[{"role": "user", "content": "Hello"}],
+            )
+            anthropic_result = wrap_anthropic(anthropic_client, **settings).messages.create(
+                model="claude-sonnet-4-20250514",
+                max_tokens=1024,
+                messages=[{"role": "user", "content": "Hello"}],
+            )
+
+        assert openai_result is openai_response
+        assert anthropic_result is anthropic_response
+        assert submit.call_count == 2
+
+
+class TestRetainBatch:
+    """Tests for retain_batch functionality."""
+
+    def setup_method(self):
+        """Reset config before each test."""
+        reset_config()
+
+    def teardown_method(self):
+        """Clean up after each test."""
+        cleanup()
+
+    def test_retain_batch_sends_single_request(self):
+        """Test retain_batch stores all items with one retain_batch call."""
+        from unittest.mock import MagicMock, patch
+        from hindsight_litellm import retain_batch
+
+        configure(hindsight_api_url="http://localhost:8888")
+        set_defaults(bank_id="test-agent", document_id="doc-123", tags=["user:alice"])
+
+        mock_hindsight_client = MagicMock()
+        mock_hindsight_client.retain_batch.return_value = MagicMock(success=True, items_count=2)
+        with patch("hindsight_litellm.wrappers._get_client", return_value=mock_hindsight_client):
+            result = retain_batch(
+                [
+                    {"content": "User prefers dark mode"},
+                    {"content": "User lives in Berlin", "document_id": "doc-456"},
+                ],
+                sync=True,
+            )
+
+        assert result.success is True
+        assert result.items_count == 2
+        mock_hindsight_client.retain_batch.assert_called_once()
+        call_kwargs = mock_hindsight_client.retain_batch.call_args[1]
+        assert call_kwargs["bank_id"] == "test-agent"
+        items = call_kwargs["items"]
+        assert [item["document_id"] for item in items] == ["doc-123", "doc-456"]
+        assert all(item["tags"] == ["user:alice"] for item in items)
+
+    def test_retain_batch_empty_items(self):
+        """Test retain_batch with no items does not call the API."""
+        from unittest.mock import MagicMock, patch
+        from hindsight_litellm import retain_batch
+
+        configure(hindsight_api_url="http://localhost:8888")
+        set_defaults(bank_id="test-agent")
+
+        mock_hindsight_client = MagicMock()
+        with patch("hindsight_litellm.wrappers._get_client", return_value=mock_hindsight_client):
+            result = retain_batch([], sync=True)
+
+        assert result.items_count == 0
+        mock_hindsight_client.retain_batch.assert_not_called()
+
+
+class TestMinQueryLength:
+    """Tests for skipping memory injection on short queries."""
+
+    def test_short_query_skips_recall(self):
+        """Test that queries below min_query_length don't trigger a recall."""
+        from unittest.mock import MagicMock, Mock, patch
+        from hindsight_litellm.wrappers import wrap_openai
+
+        mock_client = Mock()
+        wrapped = wrap_openai(
+            mock_client,
+            hindsight_api_url="http://localhost:8888",
+            bank_id="test-agent",
+            store_conversations=False,
+            min_query_length=8,
+        )
+
+        mock_hindsight_client = MagicMock()
+        mock_hindsight_client.recall.return_value = []
+        with patch.object(wrapped, "_get_hindsight_client", return_value=mock_hindsight_client):
+            wrapped.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[{"role": "user", "content": "hi"}],
+            )
+            mock_hindsight_client.recall.assert_not_called()
+
+            wrapped.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[{"role": "user", "content": "What are my favorite books?"}],
+            )
+            mock_hindsight_client.recall.assert_called_once()
+
+
+    def test_short_query_skips_callback_recall(self):
+        """Test that the LiteLLM callback applies min_query_length to hindsight_query."""
+        from unittest.mock import patch
+
+        configure(hindsight_api_url="http://localhost:8888", bank_id="test-agent", min_query_length=8)
+        callback = HindsightCallback()
+        try:
+            with patch.object(callback, "_recall_memories_sync", return_value=[]) as recall:
+                messages = [{"role": "user", "content": "hi"}]
+                callback.log_pre_api_call("gpt-4o-mini", messages, {"hindsight_query": "hi"})
+                recall.assert_not_called()
+
+                callback.log_pre_api_call(
+                    "gpt-4o-mini", messages, {"hindsight_query": "What are my favorite books?"}
+                )
+                recall.assert_called_once()
+        finally:
+            callback.close()
+            reset_config()
+
+    def test_short_query_skips_inject_memories(self):
+        """Test that _inject_memories applies min_query_length set via set_defaults."""
+        from unittest.mock import patch
+        from hindsight_litellm import _inject_memories
+
+        configure(hindsight_api_url="http://localhost:8888")
+        set_defaults(bank_id="test-agent", min_query_length=8)
+        messages = [{"role": "user", "content": "hi"}]
+        try:
+            with patch("hindsight_litellm._get_client") as get_client:
+                assert _inject_memories(messages, custom_query="hi") == messages
+                get_client.assert_not_called()
+        finally:
+            reset_config()
+
+
+class TestFactTypeLabel:
+    """Tests for the fact type labels used in injected memory context."""
+
+    def test_fact_type_label(self):
+        """Test known, unknown and missing fact types."""
+        from hindsight_litellm.wrappers import fact_type_label
+
+        assert fact_type_label("world") == "WORLD"
+        assert fact_type_label("observation") == "OBSERVATION"
+        assert fact_type_label("custom") == "CUSTOM"
+        assert fact_type_label("") == "MEMORY"
+        assert fact_type_label(None) == "MEMORY"
+
+
+class TestMemoryInjectionBudget:
+    """Tests for the token budget used when recalling memories for injection."""
+
+    def teardown_method(self):
+        """Clean up after each test."""
+        cleanup()
+
+    def test_long_facts_use_configured_token_budget(self):
+        """Test that max_memories doesn't shrink the recall budget below max_memory_tokens."""
+        from types import SimpleNamespace
+        from unittest.mock import MagicMock, Mock, patch
+        from hindsight_litellm.wrappers import wrap_openai
+
+        mock_client = Mock()
+        wrapped = wrap_openai(
+            mock_client,
+            hindsight_api_url="http://localhost:8888",
+            bank_id="test-agent",
+            store_conversations=False,
+            max_memories=3,
+            max_memory_tokens=4096,
+        )
+
+        long_facts = [
+            SimpleNamespace(text=f"Fact {i}: " + "detail " * 400, type="world")
+            for i in range(3)
+        ]
+        mock_hindsight_client = MagicMock()
+        mock_hindsight_client.recall.return_value = long_facts
+        with patch.object(wrapped, "_get_hindsight_client", return_value=mock_hindsight_client):
+            wrapped.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[{"role": "user", "content": "What are my favorite books?"}],
+            )
+
+        assert mock_hindsight_client.recall.call_args[1]["max_tokens"] == 4096
+        sent_messages = mock_client.chat.completions.create.call_args[1]["messages"]
+        system_content = sent_messages[0]["content"]
+        for i in range(3):
+            assert f"Fact {i}:" in system_content
+
+
+class TestRecallCircuitBreaker:
+    """Tests for skipping recall while the Hindsight backend is failing."""
+
+    def teardown_method(self):
+        """Clean up after each test."""
+        cleanup()
+
+    def test_breaker_opens_after_consecutive_failures(self):
+        """Test that repeated recall failures stop further recall attempts."""
+        from unittest.mock import MagicMock, Mock, patch
+        from hindsight_litellm.wrappers import _RECALL_BREAKER_THRESHOLD, wrap_openai
+
+        mock_client = Mock()
+        wrapped = wrap_openai(
+            mock_client,
+            hindsight_api_url="http://localhost:8888",
+            bank_id="test-agent",
+            store_conversations=False,
+        )
+
+        mock_hindsight_client = MagicMock()
+        mock_hindsight_client.recall.side_effect = ConnectionError("backend down")
+        with patch.object(wrapped, "_get_hindsight_client", return_value=mock_hindsight_client):
+            for _ in range(_RECALL_BREAKER_THRESHOLD + 3):
+                wrapped.chat.completions.create(
+                    model="gpt-4o-mini",
+                    messages=[{"role": "user", "content": "What are my favorite books?"}],
+                )
+
+        assert mock_hindsight_client.recall.call_count == _RECALL_BREAKER_THRESHOLD
+        # The chat call itself still goes through while recall is skipped
+        assert mock_client.chat.completions.create.call_count == _RECALL_BREAKER_THRESHOLD + 3
+
+    def test_breaker_is_per_endpoint(self):
+        """Test that a breaker tripped for one Hindsight endpoint doesn't block another."""
+        from unittest.mock import MagicMock, Mock, patch
+        from hindsight_litellm.wrappers import _RECALL_BREAKER_THRESHOLD, wrap_openai
+
+        failing = wrap_openai(
+            Mock(),
+            hindsight_api_url="http://hindsight-a:8888",
+            bank_id="test-agent",
+            store_conversations=False,
+        )
+        healthy = wrap_openai(
+            Mock(),
+            hindsight_api_url="http://hindsight-b:8888",
+            bank_id="test-agent",
+            store_conversations=False,
+        )
+        messages = [{"role": "user", "content": "What are my favorite books?"}]
+
+        failing_client = MagicMock()
+        failing_client.recall.side_effect = ConnectionError("backend down")
+        with patch.object(failing, "_get_hindsight_client", return_value=failing_client):
+            for _ in range(_RECALL_BREAKER_THRESHOLD + 1):
+                failing.chat.completions.create(model="gpt-4o-mini", messages=messages)
+        assert failing_client.recall.call_count == _RECALL_BREAKER_THRESHOLD
+
+        healthy_client = MagicMock()
+        healthy_client.recall.return_value = []
+        with patch.object(healthy, "_get_hindsight_client", return_value=healthy_client):
+            healthy.chat.completions.create(model="gpt-4o-mini", messages=messages)
+        healthy_client.recall.assert_called_once()
+
+
+class TestClientCache:
+    """Tests for the per-thread Hindsight client cache."""
+
+    def _fake_hindsight_module(self):
+        from types import ModuleType
+        from unittest.mock import AsyncMock, MagicMock
+
+        module = ModuleType("hindsight_client")
+        module.Hindsight = MagicMock(side_effect=lambda **kwargs: MagicMock(aclose=AsyncMock()))
+        return module
+
+    def _run_in_thread(self, target):
+        import threading
+
+        errors = []
+
+        def runner():
+            try:
+                target()
+            except Exception as e:  # pragma: no cover - surfaced below
+                errors.append(e)
+
+        thread = threading.Thread(target=runner)
+        thread.start()
+        thread.join()
+        if errors:
+            raise errors[0]
+
+    def test_client_reused_on_thread_without_loop(self):
+        """Test that a worker thread with no event loop gets one client, not one per call."""
+        import asyncio
+        import sys
+        from unittest.mock import patch
+        from hindsight_litellm.wrappers import _close_client, _get_client
+
+        fake = self._fake_hindsight_module()
+        seen = []
+
+        def worker():
+            first = _get_client("http://localhost:8888")
+            # What the sync client does on its first request
+            asyncio.get_event_loop().run_until_complete(asyncio.sleep(0))
+            second = _get_client("http://localhost:8888")
+            seen.extend([first, second])
+            _close_client()
+
+        with patch.dict(sys.modules, {"hindsight_client": fake}):
+            self._run_in_thread(worker)
+
+        assert seen[0] is seen[1]
+        assert fake.Hindsight.call_count == 1
+        seen[0].aclose.assert_awaited_once()
+
+    def test_replaced_loop_closes_old_client(self):
+        """Test that a client bound to a closed loop is closed when it is replaced."""
+        import asyncio
+        import sys
+        from unittest.mock import patch
+        from hindsight_litellm.wrappers import _close_client, _get_client
+
+        fake = self._fake_hindsight_module()
+        seen = []
+
+        def worker():
+            first = _get_client("http://localhost:8888")
+            asyncio.get_event_loop().close()
+            second = _get_client("http://localhost:8888")
+            seen.extend([first, second])
+            _close_client()
+
+        with patch.dict(sys.modules, {"hindsight_client": fake}):
+            self._run_in_thread(worker)
+
+        assert seen[0] is not seen[1]
+        seen[0].aclose.assert_awaited_once()
+        seen[1].aclose.assert_awaited_once()
+
+
+class TestBackgroundShutdown:
+    """Tests for draining background work at interpreter exit."""
+
+    def test_drain_cancels_queued_retains_after_timeout(self):
+        """Test that retains still queued when the drain timeout expires are cancelled."""
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+        from unittest.mock import patch
+        from hindsight_litellm import wrappers
+
+        release = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            # Patch both pools so the drain never touches the real module-level ones
+            with patch.object(wrappers, "_retain_executor", executor), patch.object(
+                wrappers, "_conversation_executor", None
+            ):
+                wrappers._submit_retain(release.wait)
+                (running,) = wrappers._pending_retains
+                wrappers._submit_retain(lambda: None)
+                (queued,) = wrappers._pending_retains - {running}
+
+                wrappers._drain_background_work(timeout=0.05)
+
+                assert queued.cancelled()
+                assert not running.done()
+        finally:
+            release.set()
+            executor.shutdown(wait=True)
+            # The submitted callables don't release their queue slots themselves
+            wrappers._retain_slots.release()
+            wrappers._retain_slots.release()
+        assert running.done()
+        assert not wrappers._pending_retains
+
+    def test_drain_waits_for_queued_conversation_stores(self):
+        """Test that conversation stores finishing within the timeout are not dropped."""
+        from concurrent.futures import ThreadPoolExecutor
+        from unittest.mock import patch
+        from hindsight_litellm import wrappers
+
+        done = []
+        executor = ThreadPoolExecutor(max_workers=1)
+        with patch.object(wrappers, "_conversation_executor", executor), patch.object(
+            wrappers, "_retain_executor", None
+        ):
+            executor.submit(done.append, "stored")
+            wrappers._drain_background_work(timeout=5)
+
+        assert done == ["stored"]
+
+    def test_pools_are_recreated_after_drain(self):
+        """Test that work submitted after a drain runs on fresh pools instead of failing."""
+        from concurrent.futures import ThreadPoolExecutor
+        from unittest.mock import patch
+        from hindsight_litellm import wrappers
+
+        retain_executor = ThreadPoolExecutor(max_workers=1)
+        conversation_executor = ThreadPoolExecutor(max_workers=1)
+        with patch.object(wrappers, "_retain_executor", retain_executor), patch.object(
+            wrappers, "_conversation_executor", conversation_executor
+        ):
+            wrappers._drain_background_work(timeout=5)
+
+            new_retain_executor = wrappers._get_retain_executor()
+            new_conversation_executor = wrappers._get_conversation_executor()
+            try:
+                assert new_retain_executor is not retain_executor
+                assert new_conversation_executor is not conversation_executor
+                assert new_retain_executor.submit(lambda: "retained").result() == "retained"
+                wrappers._wait_for_conversation_stores()
+            finally:
+                new_retain_executor.shutdown(wait=True)
+                new_conversation_executor.shutdown(wait=True)